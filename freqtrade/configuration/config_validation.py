@@ -1,6 +1,7 @@
 import logging
 from copy import deepcopy
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 from jsonschema import Draft4Validator, validators
 from jsonschema.exceptions import ValidationError, best_match
@@ -23,8 +24,9 @@ def _extend_validator(validator_class):
 
     def set_defaults(validator, properties, instance, schema):
         for prop, subschema in properties.items():
-            if 'default' in subschema:
-                instance.setdefault(prop, subschema['default'])
+            if 'default' in subschema and prop not in instance:
+                # Validators are shared - so mutable defaults must not end up in the config
+                instance[prop] = deepcopy(subschema['default'])
 
         for error in validate_properties(
             validator, properties, instance, schema,
@@ -39,31 +41,44 @@ def _extend_validator(validator_class):
 FreqtradeValidator = _extend_validator(Draft4Validator)
 
 
+@lru_cache(maxsize=None)
+def _get_config_validator(required: Tuple[str, ...]):
+    """
+    Get the validator for the configuration schema with the given required properties.
+    Cached, as copying the schema and building the validator is expensive.
+    :param required: Required configuration properties
+    :return: validator instance
+    """
+    conf_schema = deepcopy(constants.CONF_SCHEMA)
+    conf_schema['required'] = list(required)
+    return FreqtradeValidator(conf_schema)
+
+
 def validate_config_schema(conf: Dict[str, Any], preliminary: bool = False) -> Dict[str, Any]:
     """
     Validate the configuration follow the Config Schema
     :param conf: Config in JSON format
     :return: Returns the config if valid, otherwise throw an exception
     """
-    conf_schema = deepcopy(constants.CONF_SCHEMA)
     if conf.get('runmode', RunMode.OTHER) in (RunMode.DRY_RUN, RunMode.LIVE):
-        conf_schema['required'] = constants.SCHEMA_TRADE_REQUIRED
+        required = constants.SCHEMA_TRADE_REQUIRED
     elif conf.get('runmode', RunMode.OTHER) in (RunMode.BACKTEST, RunMode.HYPEROPT):
         if preliminary:
-            conf_schema['required'] = constants.SCHEMA_BACKTEST_REQUIRED
+            required = constants.SCHEMA_BACKTEST_REQUIRED
         else:
-            conf_schema['required'] = constants.SCHEMA_BACKTEST_REQUIRED_FINAL
+            required = constants.SCHEMA_BACKTEST_REQUIRED_FINAL
     else:
-        conf_schema['required'] = constants.SCHEMA_MINIMAL_REQUIRED
+        required = constants.SCHEMA_MINIMAL_REQUIRED
+    validator = _get_config_validator(tuple(required))
     try:
-        FreqtradeValidator(conf_schema).validate(conf)
+        validator.validate(conf)
         return conf
     except ValidationError as e:
         logger.critical(
             f"Invalid configuration. Reason: {e}"
         )
         raise ValidationError(
-            best_match(Draft4Validator(conf_schema).iter_errors(conf)).message
+            best_match(Draft4Validator(validator.schema).iter_errors(conf)).message
         )
 
 
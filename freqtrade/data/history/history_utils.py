@@ -220,6 +220,12 @@ def _download_pair_history(pair: str, *,
             candle_type=candle_type,
             prepend=prepend)
 
+        if not data.empty and since_ms and until_ms and since_ms >= until_ms:
+            # Cached data already covers the requested timerange - no need to query the exchange
+            logger.info(f'({process}) - History data for "{pair}", {timeframe}, '
+                        f'{candle_type} in {datadir} is up to date. Skipping download.')
+            return True
+
         logger.info(f'({process}) - Download history data for "{pair}", {timeframe}, '
                     f'{candle_type} and store in {datadir}. '
                     f'From {format_ms_time(since_ms) if since_ms else "start"} to '
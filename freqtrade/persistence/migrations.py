@@ -283,6 +283,11 @@ def check_migrate(engine, decl_base, previous_tables) -> None:
     """
     Checks if migration is necessary and migrates if necessary
     """
+    if not previous_tables:
+        # New database - tables were just created from the current models.
+        set_sqlite_to_wal(engine)
+        return
+
     inspector = inspect(engine)
 
     cols_trades = inspector.get_columns('trades')
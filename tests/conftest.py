@@ -5,7 +5,7 @@ import re
 from copy import deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 from unittest.mock import MagicMock, Mock, PropertyMock
 
 import arrow
@@ -14,13 +14,15 @@ import pytest
 from telegram import Chat, Message, Update
 
 from freqtrade import constants
+from freqtrade import exchange as exchange_module
 from freqtrade.commands import Arguments
 from freqtrade.data.converter import ohlcv_to_dataframe
 from freqtrade.edge import PairInfo
 from freqtrade.enums import CandleType, MarginMode, RunMode, SignalDirection, TradingMode
 from freqtrade.exchange import Exchange
 from freqtrade.freqtradebot import FreqtradeBot
-from freqtrade.persistence import LocalTrade, Order, Trade, init_db
+from freqtrade.mixins import LoggingMixin
+from freqtrade.persistence import LocalTrade, Order, PairLocks, Trade, init_db
 from freqtrade.resolvers import ExchangeResolver
 from freqtrade.worker import Worker
 from tests.conftest_trades import (leverage_trade, mock_trade_1, mock_trade_2, mock_trade_3,
@@ -55,7 +57,21 @@ def pytest_configure(config):
 
 def log_has(line, logs):
     """Check if line is found on some caplog's message."""
-    return any(line == message for message in logs.messages)
+    return line in logs.messages
+
+
+def log_messages(caplog) -> Set[str]:
+    """
+    Snapshot of caplog's messages - check it with log_in() instead of log_has() when checking
+    many lines once the test is done logging, to avoid rebuilding caplog.messages per check.
+    Lines logged after the snapshot was taken are not in it.
+    """
+    return set(caplog.messages)
+
+
+def log_in(line, messages: Set[str]):
+    """Check if line is found in a log_messages() snapshot."""
+    return line in messages
 
 
 def log_has_re(line, logs):
@@ -65,7 +81,7 @@ def log_has_re(line, logs):
 
 def num_log_has(line, logs):
     """Check how many times line is found in caplog's messages."""
-    return sum(line == message for message in logs.messages)
+    return logs.messages.count(line)
 
 
 def num_log_has_re(line, logs):
@@ -109,24 +125,43 @@ def patch_exchange(
     api_mock=None,
     id='binance',
     mock_markets=True,
-    mock_supported_modes=True
+    mock_supported_modes=True,
+    **methods,
 ) -> None:
-    mocker.patch('freqtrade.exchange.Exchange._load_async_markets', MagicMock(return_value={}))
-    mocker.patch('freqtrade.exchange.Exchange.validate_config', MagicMock())
-    mocker.patch('freqtrade.exchange.Exchange.validate_timeframes', MagicMock())
-    mocker.patch('freqtrade.exchange.Exchange.id', PropertyMock(return_value=id))
-    mocker.patch('freqtrade.exchange.Exchange.name', PropertyMock(return_value=id.title()))
-    mocker.patch('freqtrade.exchange.Exchange.precisionMode', PropertyMock(return_value=2))
+    """
+    Patch the Exchange class so it can be instantiated without connecting to an exchange.
+    All attributes are patched with a single patch.multiple() call.
+    Classes are patched directly - string targets would be re-resolved (including a failing
+    module import attempt) for every single attribute.
+    :param methods: Further Exchange attributes to patch (e.g. fetch_ticker=ticker, get_fee=fee)
+    """
+    patches = {
+        '_load_async_markets': MagicMock(return_value={}),
+        'validate_config': MagicMock(),
+        'validate_timeframes': MagicMock(),
+        'id': PropertyMock(return_value=id),
+        'name': PropertyMock(return_value=id.title()),
+        'precisionMode': PropertyMock(return_value=2),
+    }
 
     if mock_markets:
         if isinstance(mock_markets, bool):
             mock_markets = get_markets()
-        mocker.patch('freqtrade.exchange.Exchange.markets',
-                     PropertyMock(return_value=mock_markets))
+        patches['markets'] = PropertyMock(return_value=mock_markets)
+
+    if api_mock:
+        patches['_init_ccxt'] = MagicMock(return_value=api_mock)
+    else:
+        patches['_init_ccxt'] = MagicMock()
+        patches['timeframes'] = PropertyMock(return_value=['5m', '15m', '1h', '1d'])
+
+    patches.update(methods)
+    mocker.patch.multiple(Exchange, **patches)
 
     if mock_supported_modes:
-        mocker.patch(
-            f'freqtrade.exchange.{id.capitalize()}._supported_trading_mode_margin_pairs',
+        mocker.patch.object(
+            getattr(exchange_module, id.capitalize()),
+            '_supported_trading_mode_margin_pairs',
             PropertyMock(return_value=[
                 (TradingMode.MARGIN, MarginMode.CROSS),
                 (TradingMode.MARGIN, MarginMode.ISOLATED),
@@ -135,13 +170,6 @@ def patch_exchange(
             ])
         )
 
-    if api_mock:
-        mocker.patch('freqtrade.exchange.Exchange._init_ccxt', MagicMock(return_value=api_mock))
-    else:
-        mocker.patch('freqtrade.exchange.Exchange._init_ccxt', MagicMock())
-        mocker.patch('freqtrade.exchange.Exchange.timeframes', PropertyMock(
-                return_value=['5m', '15m', '1h', '1d']))
-
 
 def get_patched_exchange(mocker, config, api_mock=None, id='binance',
                          mock_markets=True, mock_supported_modes=True) -> Exchange:
@@ -161,8 +189,8 @@ def patch_wallet(mocker, free=999.9) -> None:
 
 
 def patch_whitelist(mocker, conf) -> None:
-    mocker.patch('freqtrade.freqtradebot.FreqtradeBot._refresh_active_whitelist',
-                 MagicMock(return_value=conf['exchange']['pair_whitelist']))
+    mocker.patch.object(FreqtradeBot, '_refresh_active_whitelist',
+                        MagicMock(return_value=conf['exchange']['pair_whitelist']))
 
 
 def patch_edge(mocker) -> None:
@@ -190,10 +218,9 @@ def patch_freqtradebot(mocker, config) -> None:
     :param config: Config to pass to the bot
     :return: None
     """
+    # RPCManager is replaced as a whole - so its methods are mocks already
     mocker.patch('freqtrade.freqtradebot.RPCManager', MagicMock())
     patch_exchange(mocker)
-    mocker.patch('freqtrade.freqtradebot.RPCManager._init', MagicMock())
-    mocker.patch('freqtrade.freqtradebot.RPCManager.send_msg', MagicMock())
     patch_whitelist(mocker, config)
 
 
@@ -394,6 +421,20 @@ def patch_coingekko(mocker) -> None:
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_backtesting_switches():
+    """
+    Backtesting turns these class-level switches off and only turns them on again
+    (Backtesting.cleanup()) once the instance is garbage collected.
+    Reset them after each test, so later tests don't depend on when that happens -
+    which differs between serial, random-order and xdist runs.
+    """
+    yield
+    LoggingMixin.show_output = True
+    PairLocks.use_db = True
+    Trade.use_db = True
+
+
 @pytest.fixture(scope='function')
 def init_persistence(default_conf):
     init_db(default_conf['db_url'])
@@ -510,6 +551,26 @@ def get_default_conf_usdt(testdatadir):
     return configuration
 
 
+def clone_conf(config):
+    """
+    Copy a configuration so a test can modify it without touching the original.
+    Copies the top level, each config section, the exchange pairlists and the pairlist
+    handlers - which covers how tests modify configurations, at a fraction of the cost
+    of deepcopy().
+    :param config: Configuration to copy
+    :return: copied configuration
+    """
+    conf = {key: value.copy() if isinstance(value, dict) else value
+            for key, value in config.items()}
+    if 'exchange' in conf:
+        for key in ('pair_whitelist', 'pair_blacklist'):
+            if key in conf['exchange']:
+                conf['exchange'][key] = list(conf['exchange'][key])
+    if 'pairlists' in conf:
+        conf['pairlists'] = [pairlist.copy() for pairlist in conf['pairlists']]
+    return conf
+
+
 @pytest.fixture
 def update():
     _update = Update(0)
@@ -1423,7 +1484,8 @@ def shitcoinmarkets(markets_static):
     """
     Fixture with shitcoin markets - used to test filters in pairlists
     """
-    shitmarkets = deepcopy(markets_static)
+    # markets_static is built per test, so a shallow copy suffices to keep it unchanged
+    shitmarkets = dict(markets_static)
     shitmarkets.update({
         'HOT/BTC': {
             'id': 'HOTBTC',
@@ -1638,7 +1700,7 @@ def limit_buy_order_open():
 
 @pytest.fixture(scope='function')
 def limit_buy_order(limit_buy_order_open):
-    order = deepcopy(limit_buy_order_open)
+    order = limit_buy_order_open.copy()
     order['status'] = 'closed'
     order['filled'] = order['amount']
     order['remaining'] = 0.0
@@ -1699,7 +1761,7 @@ def limit_buy_order_old_partial():
 
 @pytest.fixture
 def limit_buy_order_old_partial_canceled(limit_buy_order_old_partial):
-    res = deepcopy(limit_buy_order_old_partial)
+    res = limit_buy_order_old_partial.copy()
     res['status'] = 'canceled'
     res['fee'] = {'cost': 0.023, 'currency': 'ETH'}
     return res
@@ -1817,7 +1879,7 @@ def limit_sell_order_open():
 
 @pytest.fixture
 def limit_sell_order(limit_sell_order_open):
-    order = deepcopy(limit_sell_order_open)
+    order = limit_sell_order_open.copy()
     order['remaining'] = 0.0
     order['filled'] = order['amount']
     order['status'] = 'closed'
@@ -1891,34 +1953,35 @@ def order_book_l2_usd():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def ohlcv_history_list():
-    return [
-        [
+    # Shared across the session - tuples keep tests from mutating the candles
+    return (
+        (
             1511686200000,  # unix timestamp ms
             8.794e-05,      # open
             8.948e-05,      # high
             8.794e-05,      # low
             8.88e-05,       # close
             0.0877869,      # volume (in quote currency)
-        ],
-        [
+        ),
+        (
             1511686500000,
             8.88e-05,
             8.942e-05,
             8.88e-05,
             8.893e-05,
             0.05874751,
-        ],
-        [
+        ),
+        (
             1511686800000,
             8.891e-05,
             8.893e-05,
             8.875e-05,
             8.877e-05,
             0.7039405
-        ]
-    ]
+        )
+    )
 
 
 @pytest.fixture
@@ -2281,11 +2344,20 @@ def tickers():
     })
 
 
-@pytest.fixture
-def result(testdatadir):
+@pytest.fixture(scope="session")
+def ohlcv_unittest_1m_list(testdatadir):
+    """
+    UNITTEST/BTC 1m candles - parsed only once per session, as the file is large.
+    Shared across the session - tuples keep tests from mutating the candles.
+    """
     with (testdatadir / 'UNITTEST_BTC-1m.json').open('r') as data_file:
-        return ohlcv_to_dataframe(json.load(data_file), '1m', pair="UNITTEST/BTC",
-                                  fill_missing=True)
+        return tuple(tuple(candle) for candle in json.load(data_file))
+
+
+@pytest.fixture
+def result(ohlcv_unittest_1m_list):
+    return ohlcv_to_dataframe(ohlcv_unittest_1m_list, '1m', pair="UNITTEST/BTC",
+                              fill_missing=True)
 
 
 @pytest.fixture(scope="function")
@@ -2540,7 +2612,7 @@ def rpc_balance():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def testdatadir() -> Path:
     """Return the path where testdata files are stored"""
     return (Path(__file__).parent / "testdata").resolve()
@@ -2827,7 +2899,7 @@ def limit_buy_order_usdt_open():
 
 @pytest.fixture(scope='function')
 def limit_buy_order_usdt(limit_buy_order_usdt_open):
-    order = deepcopy(limit_buy_order_usdt_open)
+    order = limit_buy_order_usdt_open.copy()
     order['status'] = 'closed'
     order['filled'] = order['amount']
     order['remaining'] = 0.0
@@ -2854,7 +2926,7 @@ def limit_sell_order_usdt_open():
 
 @pytest.fixture
 def limit_sell_order_usdt(limit_sell_order_usdt_open):
-    order = deepcopy(limit_sell_order_usdt_open)
+    order = limit_sell_order_usdt_open.copy()
     order['remaining'] = 0.0
     order['filled'] = order['amount']
     order['status'] = 'closed'
@@ -2880,7 +2952,7 @@ def market_buy_order_usdt():
 
 @pytest.fixture
 def market_buy_order_usdt_doublefee(market_buy_order_usdt):
-    order = deepcopy(market_buy_order_usdt)
+    order = market_buy_order_usdt.copy()
     order['fee'] = None
     # Market orders filled with 2 trades can have fees in different currencies
     # assuming the account runs out of BNB.
@@ -4,6 +4,7 @@ from pathlib import Path
 from shutil import copyfile
 
 import pytest
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.data.converter import (convert_ohlcv_format, convert_trades_format,
@@ -200,8 +201,7 @@ def test_trim_dataframe(testdatadir) -> None:
     assert not data_modify.equals(data)
     assert len(data_modify) < len(data)
     assert len(data_modify) == len(data) - 30
-    assert all(data_modify.iloc[-1] == data.iloc[-1])
-    assert all(data_modify.iloc[0] == data.iloc[30])
+    assert_frame_equal(data_modify, data.iloc[30:])
 
     data_modify = data.copy()
     tr = TimeRange('date', None, min_date + 1800, 0)
@@ -210,8 +210,7 @@ def test_trim_dataframe(testdatadir) -> None:
     assert not data_modify.equals(data)
     assert len(data_modify) < len(data)
     assert len(data_modify) == len(data) - 20
-    assert all(data_modify.iloc[-1] == data.iloc[-1])
-    assert all(data_modify.iloc[0] == data.iloc[20])
+    assert_frame_equal(data_modify, data.iloc[20:])
 
     data_modify = data.copy()
     # Remove last 30 minutes (1800 s)
@@ -220,8 +219,7 @@ def test_trim_dataframe(testdatadir) -> None:
     assert not data_modify.equals(data)
     assert len(data_modify) < len(data)
     assert len(data_modify) == len(data) - 30
-    assert all(data_modify.iloc[0] == data.iloc[0])
-    assert all(data_modify.iloc[-1] == data.iloc[-31])
+    assert_frame_equal(data_modify, data.iloc[:-30])
 
     data_modify = data.copy()
     # Remove first 25 and last 30 minutes (1800 s)
@@ -231,7 +229,7 @@ def test_trim_dataframe(testdatadir) -> None:
     assert len(data_modify) < len(data)
     assert len(data_modify) == len(data) - 55
     # first row matches 25th original row
-    assert all(data_modify.iloc[0] == data.iloc[25])
+    assert_frame_equal(data_modify, data.iloc[25:-30])
 
 
 def test_trades_remove_duplicates(trades_history):
@@ -239,8 +237,7 @@ def test_trades_remove_duplicates(trades_history):
     assert len(trades_history1) == len(trades_history) * 3
     res = trades_remove_duplicates(trades_history1)
     assert len(res) == len(trades_history)
-    for i, t in enumerate(res):
-        assert t == trades_history[i]
+    assert res == trades_history
 
 
 def test_trades_dict_to_list(fetch_trades_result):
@@ -1,10 +1,12 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
 import json
+import os
 import re
 import uuid
 from pathlib import Path
 from shutil import copyfile
+from typing import Set
 from unittest.mock import MagicMock, PropertyMock
 
 import arrow
@@ -58,13 +60,24 @@ def _clean_test_file(file: Path) -> None:
     :return: None
     """
     file_swp = Path(str(file) + '.swp')
-    # 1. Delete file from the test
-    if file.is_file():
-        file.unlink()
+    try:
+        # Rollback to the initial file - atomically overwrites the file from the test
+        file_swp.replace(file)
+    except FileNotFoundError:
+        # No backup available - delete file from the test
+        file.unlink(missing_ok=True)
+
 
-    # 2. Rollback to the initial file
-    if file_swp.is_file():
-        file_swp.rename(file)
+def _stored_files(directory: Path) -> Set[str]:
+    """
+    List files in a directory with a single directory read
+    :param directory: directory to scan - may not exist yet
+    :return: Set of file names
+    """
+    if not directory.is_dir():
+        return set()
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
 
 
 def test_load_data_30min_timeframe(mocker, caplog, default_conf, testdatadir) -> None:
@@ -206,14 +219,11 @@ def test_json_pair_trades_filename(pair, expected_result):
     assert fn == Path(expected_result + '.gz')
 
 
-def test_load_cached_data_for_updating(mocker, testdatadir) -> None:
+def test_load_cached_data_for_updating(mocker, testdatadir, ohlcv_unittest_1m_list) -> None:
 
     data_handler = get_datahandler(testdatadir, 'json')
 
-    test_data = None
-    test_filename = testdatadir.joinpath('UNITTEST_BTC-1m.json')
-    with open(test_filename, "rt") as file:
-        test_data = json.load(file)
+    test_data = ohlcv_unittest_1m_list
 
     test_data_df = ohlcv_to_dataframe(test_data, '1m', 'UNITTEST/BTC',
                                       fill_missing=False, drop_incomplete=False)
@@ -301,13 +311,12 @@ def test_download_pair_history(
     mocker.patch('freqtrade.exchange.Exchange.get_historic_ohlcv', return_value=ohlcv_history_list)
     exchange = get_patched_exchange(mocker, default_conf)
     tmpdir1 = Path(tmpdir)
-    file1_1 = tmpdir1 / f'{subdir}MEME_BTC-1m{file_tail}.json'
-    file1_5 = tmpdir1 / f'{subdir}MEME_BTC-5m{file_tail}.json'
-    file2_1 = tmpdir1 / f'{subdir}CFI_BTC-1m{file_tail}.json'
-    file2_5 = tmpdir1 / f'{subdir}CFI_BTC-5m{file_tail}.json'
+    file1_1 = f'MEME_BTC-1m{file_tail}.json'
+    file1_5 = f'MEME_BTC-5m{file_tail}.json'
+    file2_1 = f'CFI_BTC-1m{file_tail}.json'
+    file2_5 = f'CFI_BTC-5m{file_tail}.json'
 
-    assert not file1_1.is_file()
-    assert not file2_1.is_file()
+    assert not {file1_1, file2_1} & _stored_files(tmpdir1 / subdir)
 
     assert _download_pair_history(datadir=tmpdir1, exchange=exchange,
                                   pair='MEME/BTC',
@@ -318,15 +327,13 @@ def test_download_pair_history(
                                   timeframe='1m',
                                   candle_type=candle_type)
     assert not exchange._pairs_last_refresh_time
-    assert file1_1.is_file()
-    assert file2_1.is_file()
+    assert {file1_1, file2_1} <= _stored_files(tmpdir1 / subdir)
 
     # clean files freshly downloaded
-    _clean_test_file(file1_1)
-    _clean_test_file(file2_1)
+    _clean_test_file(tmpdir1 / subdir / file1_1)
+    _clean_test_file(tmpdir1 / subdir / file2_1)
 
-    assert not file1_5.is_file()
-    assert not file2_5.is_file()
+    assert not {file1_5, file2_5} & _stored_files(tmpdir1 / subdir)
 
     assert _download_pair_history(datadir=tmpdir1, exchange=exchange,
                                   pair='MEME/BTC',
@@ -337,8 +344,7 @@ def test_download_pair_history(
                                   timeframe='5m',
                                   candle_type=candle_type)
     assert not exchange._pairs_last_refresh_time
-    assert file1_5.is_file()
-    assert file2_5.is_file()
+    assert {file1_5, file2_5} <= _stored_files(tmpdir1 / subdir)
 
 
 def test_download_pair_history2(mocker, default_conf, testdatadir) -> None:
@@ -360,6 +366,35 @@ def test_download_pair_history2(mocker, default_conf, testdatadir) -> None:
     assert json_dump_mock.call_count == 3
 
 
+@pytest.mark.parametrize('prepend', [True, False])
+def test_download_pair_history_up_to_date(mocker, caplog, default_conf, tmpdir, testdatadir,
+                                          prepend) -> None:
+    tmpdir1 = Path(tmpdir)
+    copyfile(testdatadir / 'UNITTEST_BTC-1m.json', tmpdir1 / 'UNITTEST_BTC-1m.json')
+    json_dump_mock = mocker.patch(
+        'freqtrade.data.history.jsondatahandler.JsonDataHandler.ohlcv_store',
+        return_value=None)
+    ohlcv_mock = mocker.patch('freqtrade.exchange.Exchange.get_historic_ohlcv', return_value=[])
+    exchange = get_patched_exchange(mocker, default_conf)
+
+    # Stored data covers 2017-11-04 - 2017-11-14
+    timerange = TimeRange.parse_timerange('20171105-20171110')
+    assert _download_pair_history(datadir=tmpdir1, exchange=exchange, pair='UNITTEST/BTC',
+                                  timeframe='1m', candle_type='spot', timerange=timerange,
+                                  prepend=prepend)
+    assert ohlcv_mock.call_count == 0
+    assert json_dump_mock.call_count == 0
+    assert log_has_re(r'.*History data for "UNITTEST/BTC", 1m, spot in .* is up to date\. '
+                      r'Skipping download\.', caplog)
+
+    # Requested range ends after the stored data
+    timerange = TimeRange.parse_timerange('20171105-20171120')
+    assert _download_pair_history(datadir=tmpdir1, exchange=exchange, pair='UNITTEST/BTC',
+                                  timeframe='1m', candle_type='spot', timerange=timerange)
+    assert ohlcv_mock.call_count == 1
+    assert json_dump_mock.call_count == 1
+
+
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmpdir) -> None:
     mocker.patch('freqtrade.exchange.Exchange.get_historic_ohlcv',
                  side_effect=Exception('File Error'))
@@ -130,13 +130,12 @@ def test_init_ccxt_kwargs(default_conf, mocker, caplog):
     assert log_has("Applying additional ccxt config: {'TestKWARG': 11, 'TestKWARG44': 11}", caplog)
     assert log_has(asynclogmsg, caplog)
     # Test additional headers case
-    Exchange._headers = {'hello': 'world'}
+    mocker.patch.object(Exchange, '_headers', {'hello': 'world'})
     ex = Exchange(conf)
 
     assert log_has("Applying additional ccxt config: {'TestKWARG': 11, 'TestKWARG44': 11}", caplog)
     assert ex._api.headers == {'hello': 'world'}
     assert ex._ccxt_config == {}
-    Exchange._headers = {}
 
 
 def test_destroy(default_conf, mocker, caplog):
@@ -351,138 +350,86 @@ def test_price_get_one_pip(default_conf, mocker, price, precision_mode, precisio
     assert pytest.approx(exchange.price_get_one_pip(pair, price)) == expected
 
 
-def test__get_stake_amount_limit(mocker, default_conf) -> None:
-
-    exchange = get_patched_exchange(mocker, default_conf, id="binance")
-    stoploss = -0.05
-    markets = {'ETH/BTC': {'symbol': 'ETH/BTC'}}
-
+@pytest.mark.parametrize('pair,limits,price,stoploss,leverage,expected_min,expected_max', [
     # no pair found
-    mocker.patch(
-        'freqtrade.exchange.Exchange.markets',
-        PropertyMock(return_value=markets)
-    )
-    with pytest.raises(ValueError, match=r'.*get market information.*'):
-        exchange.get_min_pair_stake_amount('BNB/BTC', 1, stoploss)
-
+    ('BNB/BTC', {'cost': {'min': None, 'max': None}, 'amount': {'min': None, 'max': None}},
+     1, -0.05, 1.0, None, None),
     # no cost/amount Min
-    markets["ETH/BTC"]["limits"] = {
-        'cost': {'min': None, 'max': None},
-        'amount': {'min': None, 'max': None},
-    }
-    mocker.patch(
-        'freqtrade.exchange.Exchange.markets',
-        PropertyMock(return_value=markets)
-    )
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 1, stoploss)
-    assert result is None
-    result = exchange.get_max_pair_stake_amount('ETH/BTC', 1)
-    assert result == float('inf')
-
+    ('ETH/BTC', {'cost': {'min': None, 'max': None}, 'amount': {'min': None, 'max': None}},
+     1, -0.05, 1.0, None, float('inf')),
     # min/max cost is set
-    markets["ETH/BTC"]["limits"] = {
-        'cost': {'min': 2, 'max': 10000},
-        'amount': {'min': None, 'max': None},
-    }
-    mocker.patch(
-        'freqtrade.exchange.Exchange.markets',
-        PropertyMock(return_value=markets)
-    )
-    # min
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 1, stoploss)
-    expected_result = 2 * (1 + 0.05) / (1 - abs(stoploss))
-    assert isclose(result, expected_result)
-    # With Leverage
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 1, stoploss, 3.0)
-    assert isclose(result, expected_result / 3)
-    # max
-    result = exchange.get_max_pair_stake_amount('ETH/BTC', 2)
-    assert result == 10000
-
+    ('ETH/BTC', {'cost': {'min': 2, 'max': 10000}, 'amount': {'min': None, 'max': None}},
+     1, -0.05, 1.0, 2 * (1 + 0.05) / (1 - 0.05), 10000),
+    ('ETH/BTC', {'cost': {'min': 2, 'max': 10000}, 'amount': {'min': None, 'max': None}},
+     1, -0.05, 3.0, 2 * (1 + 0.05) / (1 - 0.05) / 3, 10000),
     # min amount is set
-    markets["ETH/BTC"]["limits"] = {
-        'cost': {'min': None, 'max': None},
-        'amount': {'min': 2, 'max': 10000},
-    }
-    mocker.patch(
-        'freqtrade.exchange.Exchange.markets',
-        PropertyMock(return_value=markets)
-    )
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, stoploss)
-    expected_result = 2 * 2 * (1 + 0.05) / (1 - abs(stoploss))
-    assert isclose(result, expected_result)
-    # With Leverage
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, stoploss, 5.0)
-    assert isclose(result, expected_result / 5)
-    # max
-    result = exchange.get_max_pair_stake_amount('ETH/BTC', 2)
-    assert result == 20000
-
+    ('ETH/BTC', {'cost': {'min': None, 'max': None}, 'amount': {'min': 2, 'max': 10000}},
+     2, -0.05, 1.0, 2 * 2 * (1 + 0.05) / (1 - 0.05), 20000),
+    ('ETH/BTC', {'cost': {'min': None, 'max': None}, 'amount': {'min': 2, 'max': 10000}},
+     2, -0.05, 5.0, 2 * 2 * (1 + 0.05) / (1 - 0.05) / 5, 20000),
     # min amount and cost are set (cost is minimal)
-    markets["ETH/BTC"]["limits"] = {
-        'cost': {'min': 2, 'max': None},
-        'amount': {'min': 2, 'max': None},
-    }
-    mocker.patch(
-        'freqtrade.exchange.Exchange.markets',
-        PropertyMock(return_value=markets)
-    )
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, stoploss)
-    expected_result = max(2, 2 * 2) * (1 + 0.05) / (1 - abs(stoploss))
-    assert isclose(result, expected_result)
-    # With Leverage
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, stoploss, 10)
-    assert isclose(result, expected_result / 10)
-
+    ('ETH/BTC', {'cost': {'min': 2, 'max': None}, 'amount': {'min': 2, 'max': None}},
+     2, -0.05, 1.0, max(2, 2 * 2) * (1 + 0.05) / (1 - 0.05), float('inf')),
+    ('ETH/BTC', {'cost': {'min': 2, 'max': None}, 'amount': {'min': 2, 'max': None}},
+     2, -0.05, 10.0, max(2, 2 * 2) * (1 + 0.05) / (1 - 0.05) / 10, float('inf')),
     # min amount and cost are set (amount is minial)
-    markets["ETH/BTC"]["limits"] = {
-        'cost': {'min': 8, 'max': 10000},
-        'amount': {'min': 2, 'max': 500},
-    }
+    ('ETH/BTC', {'cost': {'min': 8, 'max': 10000}, 'amount': {'min': 2, 'max': 500}},
+     2, -0.05, 1.0, max(8, 2 * 2) * (1 + 0.05) / (1 - 0.05), 1000),
+    ('ETH/BTC', {'cost': {'min': 8, 'max': 10000}, 'amount': {'min': 2, 'max': 500}},
+     2, -0.05, 7.0, max(8, 2 * 2) * (1 + 0.05) / (1 - 0.05) / 7, 1000),
+    ('ETH/BTC', {'cost': {'min': 8, 'max': 10000}, 'amount': {'min': 2, 'max': 500}},
+     2, -0.4, 1.0, max(8, 2 * 2) * 1.5, 1000),
+    ('ETH/BTC', {'cost': {'min': 8, 'max': 10000}, 'amount': {'min': 2, 'max': 500}},
+     2, -0.4, 8.0, max(8, 2 * 2) * 1.5 / 8, 1000),
+    # Really big stoploss
+    ('ETH/BTC', {'cost': {'min': 8, 'max': 10000}, 'amount': {'min': 2, 'max': 500}},
+     2, -1, 1.0, max(8, 2 * 2) * 1.5, 1000),
+    ('ETH/BTC', {'cost': {'min': 8, 'max': 10000}, 'amount': {'min': 2, 'max': 500}},
+     2, -1, 12.0, max(8, 2 * 2) * 1.5 / 12, 1000),
+])
+def test__get_stake_amount_limit(mocker, default_conf, pair, limits, price, stoploss, leverage,
+                                 expected_min, expected_max) -> None:
+
+    exchange = get_patched_exchange(mocker, default_conf, id="binance")
+    markets = {'ETH/BTC': {'symbol': 'ETH/BTC', 'limits': limits}}
     mocker.patch(
         'freqtrade.exchange.Exchange.markets',
         PropertyMock(return_value=markets)
     )
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, stoploss)
-    expected_result = max(8, 2 * 2) * (1 + 0.05) / (1 - abs(stoploss))
-    assert isclose(result, expected_result)
-    # With Leverage
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, stoploss, 7.0)
-    assert isclose(result, expected_result / 7.0)
-    # Max
-    result = exchange.get_max_pair_stake_amount('ETH/BTC', 2)
-    assert result == 1000
 
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, -0.4)
-    expected_result = max(8, 2 * 2) * 1.5
-    assert isclose(result, expected_result)
-    # With Leverage
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, -0.4, 8.0)
-    assert isclose(result, expected_result / 8.0)
-    # Max
-    result = exchange.get_max_pair_stake_amount('ETH/BTC', 2)
-    assert result == 1000
+    if pair not in markets:
+        with pytest.raises(ValueError, match=r'.*get market information.*'):
+            exchange.get_min_pair_stake_amount(pair, price, stoploss, leverage)
+        return
 
-    # Really big stoploss
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, -1)
-    expected_result = max(8, 2 * 2) * 1.5
-    assert isclose(result, expected_result)
-    # With Leverage
-    result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, -1, 12.0)
-    assert isclose(result, expected_result / 12)
+    result = exchange.get_min_pair_stake_amount(pair, price, stoploss, leverage)
+    if expected_min is None:
+        assert result is None
+    else:
+        assert isclose(result, expected_min)
     # Max
-    result = exchange.get_max_pair_stake_amount('ETH/BTC', 2)
-    assert result == 1000
+    result = exchange.get_max_pair_stake_amount(pair, price)
+    assert result == expected_max
+
+
+def test__get_stake_amount_limit_futures(mocker, default_conf) -> None:
 
-    markets["ETH/BTC"]["contractSize"] = '0.01'
     default_conf['trading_mode'] = 'futures'
     default_conf['margin_mode'] = 'isolated'
     exchange = get_patched_exchange(mocker, default_conf, id="binance")
+    markets = {'ETH/BTC': {'symbol': 'ETH/BTC'}}
     mocker.patch(
         'freqtrade.exchange.Exchange.markets',
         PropertyMock(return_value=markets)
     )
 
+    markets["ETH/BTC"]["limits"] = {
+        'cost': {'min': 8, 'max': 10000},
+        'amount': {'min': 2, 'max': 500},
+    }
+    markets["ETH/BTC"]["contractSize"] = '0.01'
+    expected_result = max(8, 2 * 2) * 1.5
+
     # Contract size 0.01
     result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, -1)
     assert isclose(result, expected_result * 0.01)
@@ -491,10 +438,6 @@ def test__get_stake_amount_limit(mocker, default_conf) -> None:
     assert result == 10
 
     markets["ETH/BTC"]["contractSize"] = '10'
-    mocker.patch(
-        'freqtrade.exchange.Exchange.markets',
-        PropertyMock(return_value=markets)
-    )
     # With Leverage, Contract size 10
     result = exchange.get_min_pair_stake_amount('ETH/BTC', 2, -1, 12.0)
     assert isclose(result, (expected_result / 12) * 10.0)
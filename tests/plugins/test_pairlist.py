@@ -1,7 +1,6 @@
 # pragma pylint: disable=missing-docstring,C0103,protected-access
 
 import logging
-import time
 from unittest.mock import MagicMock, PropertyMock
 
 import pandas as pd
@@ -123,9 +122,8 @@ def test_log_cached(mocker, static_pl_conf, markets, tickers):
     assert pl._log_cache.currsize == 2
 
 
-def test_load_pairlist_noexist(mocker, markets, default_conf):
+def test_load_pairlist_noexist(mocker, default_conf):
     freqtrade = get_patched_freqtradebot(mocker, default_conf)
-    mocker.patch('freqtrade.exchange.Exchange.markets', PropertyMock(return_value=markets))
     plm = PairListManager(freqtrade.exchange, default_conf)
     with pytest.raises(OperationalException,
                        match=r"Impossible to load Pairlist 'NonexistingPairList'. "
@@ -148,11 +146,9 @@ def test_load_pairlist_verify_multi(mocker, markets_static, default_conf):
     assert plm.verify_whitelist(['ETH/BTC', 'XRP/BTC', ], print) == ['ETH/BTC', 'XRP/BTC']
 
 
-def test_refresh_market_pair_not_in_whitelist(mocker, markets, static_pl_conf):
+def test_refresh_market_pair_not_in_whitelist(mocker, static_pl_conf):
 
     freqtrade = get_patched_freqtradebot(mocker, static_pl_conf)
-
-    mocker.patch('freqtrade.exchange.Exchange.markets', PropertyMock(return_value=markets))
     freqtrade.pairlists.refresh_pairlist()
     # List ordered by BaseVolume
     whitelist = ['ETH/BTC', 'TKN/BTC']
@@ -163,13 +159,9 @@ def test_refresh_market_pair_not_in_whitelist(mocker, markets, static_pl_conf):
             freqtrade.config['exchange']['pair_whitelist'])
 
 
-def test_refresh_static_pairlist(mocker, markets, static_pl_conf):
+def test_refresh_static_pairlist(mocker, static_pl_conf):
     freqtrade = get_patched_freqtradebot(mocker, static_pl_conf)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
-        exchange_has=MagicMock(return_value=True),
-        markets=PropertyMock(return_value=markets),
-    )
+    mocker.patch('freqtrade.exchange.Exchange.exchange_has', MagicMock(return_value=True))
     freqtrade.pairlists.refresh_pairlist()
     # List ordered by BaseVolume
     whitelist = ['ETH/BTC', 'TKN/BTC']
@@ -184,16 +176,12 @@ def test_refresh_static_pairlist(mocker, markets, static_pl_conf):
     (['NOEXIST/BTC', r'*/BTC'],  # This is an invalid regex
      []),
 ])
-def test_refresh_static_pairlist_noexist(mocker, markets, static_pl_conf, pairs, expected, caplog):
+def test_refresh_static_pairlist_noexist(mocker, static_pl_conf, pairs, expected, caplog):
 
     static_pl_conf['pairlists'][0]['allow_inactive'] = True
     static_pl_conf['exchange']['pair_whitelist'] += pairs
     freqtrade = get_patched_freqtradebot(mocker, static_pl_conf)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
-        exchange_has=MagicMock(return_value=True),
-        markets=PropertyMock(return_value=markets),
-    )
+    mocker.patch('freqtrade.exchange.Exchange.exchange_has', MagicMock(return_value=True))
     freqtrade.pairlists.refresh_pairlist()
 
     # Ensure all except those in whitelist are removed
@@ -203,14 +191,10 @@ def test_refresh_static_pairlist_noexist(mocker, markets, static_pl_conf, pairs,
         assert log_has_re(r'Pair whitelist contains an invalid Wildcard: Wildcard error.*', caplog)
 
 
-def test_invalid_blacklist(mocker, markets, static_pl_conf, caplog):
+def test_invalid_blacklist(mocker, static_pl_conf, caplog):
     static_pl_conf['exchange']['pair_blacklist'] = ['*/BTC']
     freqtrade = get_patched_freqtradebot(mocker, static_pl_conf)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
-        exchange_has=MagicMock(return_value=True),
-        markets=PropertyMock(return_value=markets),
-    )
+    mocker.patch('freqtrade.exchange.Exchange.exchange_has', MagicMock(return_value=True))
     freqtrade.pairlists.refresh_pairlist()
     whitelist = []
     # Ensure all except those in whitelist are removed
@@ -219,14 +203,10 @@ def test_invalid_blacklist(mocker, markets, static_pl_conf, caplog):
     log_has_re(r"Pair blacklist contains an invalid Wildcard.*", caplog)
 
 
-def test_remove_logs_for_pairs_already_in_blacklist(mocker, markets, static_pl_conf, caplog):
+def test_remove_logs_for_pairs_already_in_blacklist(mocker, static_pl_conf, caplog):
     logger = logging.getLogger(__name__)
     freqtrade = get_patched_freqtradebot(mocker, static_pl_conf)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
-        exchange_has=MagicMock(return_value=True),
-        markets=PropertyMock(return_value=markets),
-    )
+    mocker.patch('freqtrade.exchange.Exchange.exchange_has', MagicMock(return_value=True))
     freqtrade.pairlists.refresh_pairlist()
     whitelist = ['ETH/BTC', 'TKN/BTC']
     caplog.clear()
@@ -296,8 +276,9 @@ def test_refresh_pairlist_dynamic_2(mocker, shitcoinmarkets, tickers, whitelist_
     freqtrade.pairlists.refresh_pairlist()
     assert whitelist == freqtrade.pairlists.whitelist
 
-    # Delay to allow 0 TTL cache to expire...
-    time.sleep(1)
+    # refresh_period is 0 - but TTLCache only expires once the clock has moved on,
+    # which is not guaranteed between two back-to-back calls. Drop the cached pairlist.
+    freqtrade.pairlists._pairlist_handlers[0]._pair_cache.clear()
     whitelist = ['FUEL/BTC', 'ETH/BTC', 'TKN/BTC', 'LTC/BTC', 'XRP/BTC']
     tickers_dict['FUEL/BTC']['quoteVolume'] = 10000.0
     freqtrade.pairlists.refresh_pairlist()
@@ -313,12 +294,11 @@ def test_VolumePairList_refresh_empty(mocker, markets_empty, whitelist_conf):
     mocker.patch('freqtrade.exchange.Exchange.markets', PropertyMock(return_value=markets_empty))
 
     # argument: use the whitelist dynamically by exchange-volume
-    whitelist = []
     whitelist_conf['exchange']['pair_whitelist'] = []
     freqtrade.pairlists.refresh_pairlist()
     pairslist = whitelist_conf['exchange']['pair_whitelist']
 
-    assert set(whitelist) == set(pairslist)
+    assert pairslist == []
 
 
 @pytest.mark.parametrize("pairlists,base_currency,whitelist_result", [
@@ -1,6 +1,5 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
-import time
 from unittest.mock import MagicMock
 
 from freqtrade.enums import RPCMessageType
@@ -185,8 +184,6 @@ def test_init_apiserver_enabled(mocker, default_conf, caplog) -> None:
                                   }
     rpc_manager = RPCManager(get_patched_freqtradebot(mocker, default_conf))
 
-    # Sleep to allow the thread to start
-    time.sleep(0.5)
     assert log_has('Enabling rpc.api_server', caplog)
     assert len(rpc_manager.registered_modules) == 1
     assert 'apiserver' in [mod.name for mod in rpc_manager.registered_modules]
@@ -1,9 +1,9 @@
 # pragma pylint: disable=missing-docstring, protected-access, invalid-name
+import io
 import json
 import logging
 import sys
 import warnings
-from copy import deepcopy
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -12,7 +12,7 @@ from jsonschema import ValidationError
 
 from freqtrade.commands import Arguments
 from freqtrade.configuration import Configuration, check_exchange, validate_config_consistency
-from freqtrade.configuration.config_validation import validate_config_schema
+from freqtrade.configuration.config_validation import _get_config_validator, validate_config_schema
 from freqtrade.configuration.deprecated_settings import (check_conflicting_settings,
                                                          process_deprecated_setting,
                                                          process_removed_setting,
@@ -24,10 +24,15 @@ from freqtrade.constants import DEFAULT_DB_DRYRUN_URL, DEFAULT_DB_PROD_URL, ENV_
 from freqtrade.enums import RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.loggers import FTBufferingHandler, _set_loggers, setup_logging, setup_logging_pre
-from tests.conftest import (CURRENT_TEST_STRATEGY, log_has, log_has_re,
+from tests.conftest import (CURRENT_TEST_STRATEGY, clone_conf, get_default_conf, log_has,
+                            log_has_re, log_in, log_messages,
                             patched_configuration_load_config_file)
 
 
+# Keys every loaded configuration contains
+_EXPECTED_CONFIG_KEYS = {'max_open_trades', 'stake_currency', 'stake_amount', 'exchange', 'datadir'}
+
+
 @pytest.fixture(scope="function")
 def all_conf():
     config_file = Path(__file__).parents[1] / "config_examples/config_full.example.json"
@@ -35,14 +40,29 @@ def all_conf():
     return conf
 
 
+@pytest.fixture(scope="module")
+def default_conf_json(testdatadir):
+    """ default_conf as written to a config file - serialized once per module """
+    conf = get_default_conf(testdatadir)
+    # Paths are not json serializable
+    del conf['user_data_dir']
+    return json.dumps(conf)
+
+
+def _patch_open(mocker, data):
+    """ Patch open() in load_config to return a real file-like object holding data """
+    return mocker.patch('freqtrade.configuration.load_config.open',
+                        return_value=io.StringIO(data))
+
+
 def test_load_config_missing_attributes(default_conf) -> None:
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf.pop('exchange')
 
     with pytest.raises(ValidationError, match=r".*'exchange' is a required property.*"):
         validate_config_schema(conf)
 
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf.pop('stake_currency')
     conf['runmode'] = RunMode.DRY_RUN
     with pytest.raises(ValidationError, match=r".*'stake_currency' is a required property.*"):
@@ -56,31 +76,28 @@ def test_load_config_incorrect_stake_amount(default_conf) -> None:
         validate_config_schema(default_conf)
 
 
-def test_load_config_file(default_conf, mocker, caplog) -> None:
+def test_load_config_file(default_conf, default_conf_json, mocker, caplog) -> None:
     del default_conf['user_data_dir']
-    file_mock = mocker.patch('freqtrade.configuration.load_config.open', mocker.mock_open(
-        read_data=json.dumps(default_conf)
-    ))
+    file_mock = _patch_open(mocker, default_conf_json)
 
     validated_conf = load_config_file('somefile')
     assert file_mock.call_count == 1
     assert validated_conf.items() >= default_conf.items()
 
 
-def test_load_config_file_error(default_conf, mocker, caplog) -> None:
-    del default_conf['user_data_dir']
-    filedata = json.dumps(default_conf).replace(
+def test_load_config_file_error(default_conf_json, mocker, caplog) -> None:
+    filedata = default_conf_json.replace(
         '"stake_amount": 0.001,', '"stake_amount": .001,')
-    mocker.patch('freqtrade.configuration.load_config.open', mocker.mock_open(read_data=filedata))
+    _patch_open(mocker, filedata)
     mocker.patch.object(Path, "read_text", MagicMock(return_value=filedata))
 
     with pytest.raises(OperationalException, match=r".*Please verify the following segment.*"):
         load_config_file('somefile')
 
 
-def test_load_config_file_error_range(default_conf, mocker, caplog) -> None:
+def test_load_config_file_error_range(default_conf, default_conf_json, mocker, caplog) -> None:
     del default_conf['user_data_dir']
-    filedata = json.dumps(default_conf).replace(
+    filedata = default_conf_json.replace(
         '"stake_amount": 0.001,', '"stake_amount": .001,')
     mocker.patch.object(Path, "read_text", MagicMock(return_value=filedata))
 
@@ -150,8 +167,8 @@ def test_load_config_max_open_trades_zero(default_conf, mocker, caplog) -> None:
 
 
 def test_load_config_combine_dicts(default_conf, mocker, caplog) -> None:
-    conf1 = deepcopy(default_conf)
-    conf2 = deepcopy(default_conf)
+    conf1 = clone_conf(default_conf)
+    conf2 = clone_conf(default_conf)
     del conf1['exchange']['key']
     del conf1['exchange']['secret']
     del conf2['exchange']['name']
@@ -181,8 +198,8 @@ def test_load_config_combine_dicts(default_conf, mocker, caplog) -> None:
 
 
 def test_from_config(default_conf, mocker, caplog) -> None:
-    conf1 = deepcopy(default_conf)
-    conf2 = deepcopy(default_conf)
+    conf1 = clone_conf(default_conf)
+    conf2 = clone_conf(default_conf)
     del conf1['exchange']['key']
     del conf1['exchange']['secret']
     del conf2['exchange']['name']
@@ -235,7 +252,7 @@ def test_from_recursive_files(testdatadir) -> None:
 
 
 def test_print_config(default_conf, mocker, caplog) -> None:
-    conf1 = deepcopy(default_conf)
+    conf1 = clone_conf(default_conf)
     # Delete non-json elements from default_conf
     del conf1['user_data_dir']
     config_files = [conf1]
@@ -305,64 +322,25 @@ def test_load_config_with_params(default_conf, mocker) -> None:
     assert validated_conf.get('strategy_path') == '/some/path'
     assert validated_conf.get('db_url') == 'sqlite:///someurl'
 
-    # Test conf provided db_url prod
-    conf = default_conf.copy()
-    conf["dry_run"] = False
-    conf["db_url"] = "sqlite:///path/to/db.sqlite"
-    patched_configuration_load_config_file(mocker, conf)
-
-    arglist = [
-        'trade',
-        '--strategy', 'TestStrategy',
-        '--strategy-path', '/some/path'
-    ]
-    args = Arguments(arglist).get_parsed_arg()
-
-    configuration = Configuration(args)
-    validated_conf = configuration.load_config()
-    assert validated_conf.get('db_url') == "sqlite:///path/to/db.sqlite"
-
-    # Test conf provided db_url dry_run
-    conf = default_conf.copy()
-    conf["dry_run"] = True
-    conf["db_url"] = "sqlite:///path/to/db.sqlite"
-    patched_configuration_load_config_file(mocker, conf)
-
-    arglist = [
-        'trade',
-        '--strategy', 'TestStrategy',
-        '--strategy-path', '/some/path'
-    ]
-    args = Arguments(arglist).get_parsed_arg()
-
-    configuration = Configuration(args)
-    validated_conf = configuration.load_config()
-    assert validated_conf.get('db_url') == "sqlite:///path/to/db.sqlite"
 
-    # Test args provided db_url prod
-    conf = default_conf.copy()
-    conf["dry_run"] = False
-    del conf["db_url"]
-    patched_configuration_load_config_file(mocker, conf)
-
-    arglist = [
-        'trade',
-        '--strategy', 'TestStrategy',
-        '--strategy-path', '/some/path'
-    ]
-    args = Arguments(arglist).get_parsed_arg()
-
-    configuration = Configuration(args)
-    validated_conf = configuration.load_config()
-    assert validated_conf.get('db_url') == DEFAULT_DB_PROD_URL
-    assert "runmode" in validated_conf
-    assert validated_conf['runmode'] == RunMode.LIVE
-
-    # Test args provided db_url dry_run
-    conf = default_conf.copy()
-    conf["dry_run"] = True
-    conf["db_url"] = DEFAULT_DB_PROD_URL
-    patched_configuration_load_config_file(mocker, conf)
+@pytest.mark.parametrize("dry_run,db_url,expected_db_url,expected_runmode", [
+    # conf provided db_url prod
+    (False, "sqlite:///path/to/db.sqlite", "sqlite:///path/to/db.sqlite", RunMode.LIVE),
+    # conf provided db_url dry_run
+    (True, "sqlite:///path/to/db.sqlite", "sqlite:///path/to/db.sqlite", RunMode.DRY_RUN),
+    # No db_url provided - use prod default
+    (False, None, DEFAULT_DB_PROD_URL, RunMode.LIVE),
+    # prod db_url in dry_run - use dry_run default
+    (True, DEFAULT_DB_PROD_URL, DEFAULT_DB_DRYRUN_URL, RunMode.DRY_RUN),
+])
+def test_load_config_db_url(default_conf, mocker, dry_run, db_url, expected_db_url,
+                            expected_runmode) -> None:
+    default_conf["dry_run"] = dry_run
+    if db_url:
+        default_conf["db_url"] = db_url
+    else:
+        del default_conf["db_url"]
+    patched_configuration_load_config_file(mocker, default_conf)
 
     arglist = [
         'trade',
@@ -373,7 +351,8 @@ def test_load_config_with_params(default_conf, mocker) -> None:
 
     configuration = Configuration(args)
     validated_conf = configuration.load_config()
-    assert validated_conf.get('db_url') == DEFAULT_DB_DRYRUN_URL
+    assert validated_conf.get('db_url') == expected_db_url
+    assert validated_conf['runmode'] == expected_runmode
 
 
 @pytest.mark.parametrize("config_value,expected,arglist", [
@@ -439,19 +418,14 @@ def test_setup_configuration_without_arguments(mocker, default_conf, caplog) ->
 
     configuration = Configuration(args)
     config = configuration.get_config()
-    assert 'max_open_trades' in config
-    assert 'stake_currency' in config
-    assert 'stake_amount' in config
-    assert 'exchange' in config
+    logs = log_messages(caplog)
+    assert _EXPECTED_CONFIG_KEYS | {'user_data_dir', 'timeframe'} <= config.keys()
     assert 'pair_whitelist' in config['exchange']
-    assert 'datadir' in config
-    assert 'user_data_dir' in config
-    assert log_has('Using data directory: {} ...'.format(config['datadir']), caplog)
-    assert 'timeframe' in config
-    assert not log_has('Parameter -i/--timeframe detected ...', caplog)
+    assert log_in('Using data directory: {} ...'.format(config['datadir']), logs)
+    assert not log_in('Parameter -i/--timeframe detected ...', logs)
 
     assert 'position_stacking' not in config
-    assert not log_has('Parameter --enable-position-stacking detected ...', caplog)
+    assert not log_in('Parameter --enable-position-stacking detected ...', logs)
 
     assert 'timerange' not in config
 
@@ -484,33 +458,20 @@ def test_setup_configuration_with_arguments(mocker, default_conf, caplog) -> Non
 
     configuration = Configuration(args)
     config = configuration.get_config()
-    assert 'max_open_trades' in config
-    assert 'stake_currency' in config
-    assert 'stake_amount' in config
-    assert 'exchange' in config
+    logs = log_messages(caplog)
+    assert _EXPECTED_CONFIG_KEYS | {
+        'user_data_dir', 'timeframe', 'position_stacking', 'use_max_market_positions',
+        'timerange', 'export'} <= config.keys()
     assert 'pair_whitelist' in config['exchange']
-    assert 'datadir' in config
-    assert log_has('Using data directory: {} ...'.format("/foo/bar"), caplog)
-    assert log_has('Using user-data directory: {} ...'.format(Path("/tmp/freqtrade")), caplog)
-    assert 'user_data_dir' in config
-
-    assert 'timeframe' in config
-    assert log_has('Parameter -i/--timeframe detected ... Using timeframe: 1m ...',
-                   caplog)
-
-    assert 'position_stacking' in config
-    assert log_has('Parameter --enable-position-stacking detected ...', caplog)
-
-    assert 'use_max_market_positions' in config
-    assert log_has('Parameter --disable-max-market-positions detected ...', caplog)
-    assert log_has('max_open_trades set to unlimited ...', caplog)
-
-    assert 'timerange' in config
-    assert log_has('Parameter --timerange detected: {} ...'.format(config['timerange']), caplog)
-
-    assert 'export' in config
-    assert log_has('Parameter --export detected: {} ...'.format(config['export']), caplog)
-    assert 'stake_amount' in config
+    assert log_in('Using data directory: {} ...'.format("/foo/bar"), logs)
+    assert log_in('Using user-data directory: {} ...'.format(Path("/tmp/freqtrade")), logs)
+    assert log_in('Parameter -i/--timeframe detected ... Using timeframe: 1m ...',
+                  logs)
+    assert log_in('Parameter --enable-position-stacking detected ...', logs)
+    assert log_in('Parameter --disable-max-market-positions detected ...', logs)
+    assert log_in('max_open_trades set to unlimited ...', logs)
+    assert log_in('Parameter --timerange detected: {} ...'.format(config['timerange']), logs)
+    assert log_in('Parameter --export detected: {} ...'.format(config['export']), logs)
     assert config['stake_amount'] == 'unlimited'
 
 
@@ -534,20 +495,14 @@ def test_setup_configuration_with_stratlist(mocker, default_conf, caplog) -> Non
 
     configuration = Configuration(args, RunMode.BACKTEST)
     config = configuration.get_config()
+    logs = log_messages(caplog)
     assert config['runmode'] == RunMode.BACKTEST
-    assert 'max_open_trades' in config
-    assert 'stake_currency' in config
-    assert 'stake_amount' in config
-    assert 'exchange' in config
+    assert _EXPECTED_CONFIG_KEYS | {'timeframe', 'strategy_list'} <= config.keys()
     assert 'pair_whitelist' in config['exchange']
-    assert 'datadir' in config
-    assert log_has('Using data directory: {} ...'.format(config['datadir']), caplog)
-    assert 'timeframe' in config
-    assert log_has('Parameter -i/--timeframe detected ... Using timeframe: 1m ...',
-                   caplog)
-
-    assert 'strategy_list' in config
-    assert log_has('Using strategy list of 2 strategies', caplog)
+    assert log_in('Using data directory: {} ...'.format(config['datadir']), logs)
+    assert log_in('Parameter -i/--timeframe detected ... Using timeframe: 1m ...',
+                  logs)
+    assert log_in('Using strategy list of 2 strategies', logs)
 
     assert 'position_stacking' not in config
 
@@ -556,7 +511,7 @@ def test_setup_configuration_with_stratlist(mocker, default_conf, caplog) -> Non
     assert 'timerange' not in config
 
     assert 'export' in config
-    assert log_has('Parameter --export detected: {} ...'.format(config['export']), caplog)
+    assert log_in('Parameter --export detected: {} ...'.format(config['export']), logs)
 
 
 def test_hyperopt_with_arguments(mocker, default_conf, caplog) -> None:
@@ -816,6 +771,26 @@ def test_validate_default_conf(default_conf) -> None:
     validate_config_schema(default_conf)
 
 
+def test_validate_config_schema_cached_validator(default_conf) -> None:
+    _get_config_validator.cache_clear()
+    del default_conf['internals']
+    conf1 = clone_conf(default_conf)
+    conf2 = clone_conf(default_conf)
+    validate_config_schema(conf1)
+    validate_config_schema(conf2)
+    info = _get_config_validator.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    # Defaults are set per config and not shared through the cached schema
+    assert conf1['internals'] == {}
+    assert conf1['internals'] is not conf2['internals']
+
+    # Different required properties use a separate validator
+    conf1['runmode'] = RunMode.BACKTEST
+    validate_config_schema(conf1)
+    assert _get_config_validator.cache_info().misses == 2
+
+
 def test_validate_max_open_trades(default_conf):
     default_conf['max_open_trades'] = float('inf')
     default_conf['stake_amount'] = 'unlimited'
@@ -834,20 +809,20 @@ def test_validate_price_side(default_conf):
     # Default should pass
     validate_config_consistency(default_conf)
 
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['order_types']['entry'] = 'market'
     with pytest.raises(OperationalException,
                        match='Market entry orders require entry_pricing.price_side = "other".'):
         validate_config_consistency(conf)
 
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['order_types']['exit'] = 'market'
     with pytest.raises(OperationalException,
                        match='Market exit orders require exit_pricing.price_side = "other".'):
         validate_config_consistency(conf)
 
     # Validate inversed case
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['order_types']['exit'] = 'market'
     conf['order_types']['entry'] = 'market'
     conf['exit_pricing']['price_side'] = 'bid'
@@ -913,7 +888,7 @@ def test_validate_whitelist(default_conf):
     default_conf['runmode'] = RunMode.DRY_RUN
     # Test regular case - has whitelist and uses StaticPairlist
     validate_config_consistency(default_conf)
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     del conf['exchange']['pair_whitelist']
     # Test error case
     with pytest.raises(OperationalException,
@@ -921,7 +896,7 @@ def test_validate_whitelist(default_conf):
 
         validate_config_consistency(conf)
 
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
 
     conf.update({"pairlists": [{
         "method": "VolumePairList",
@@ -943,7 +918,7 @@ def test_validate_whitelist(default_conf):
        "stop_duration_candles": 10}], r'Protections must specify either `stop_duration`.*'),
 ])
 def test_validate_protections(default_conf, protconf, expected):
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['protections'] = protconf
     if expected:
         with pytest.raises(OperationalException, match=expected):
@@ -953,7 +928,7 @@ def test_validate_protections(default_conf, protconf, expected):
 
 
 def test_validate_ask_orderbook(default_conf, caplog) -> None:
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['exit_pricing']['use_order_book'] = True
     conf['exit_pricing']['order_book_min'] = 2
     conf['exit_pricing']['order_book_max'] = 2
@@ -970,7 +945,7 @@ def test_validate_ask_orderbook(default_conf, caplog) -> None:
 
 
 def test_validate_time_in_force(default_conf, caplog) -> None:
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['order_time_in_force'] = {
         'buy': 'gtc',
         'sell': 'gtc',
@@ -980,7 +955,7 @@ def test_validate_time_in_force(default_conf, caplog) -> None:
     assert conf['order_time_in_force']['entry'] == 'gtc'
     assert conf['order_time_in_force']['exit'] == 'gtc'
 
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['order_time_in_force'] = {
         'buy': 'gtc',
         'sell': 'gtc',
@@ -992,7 +967,7 @@ def test_validate_time_in_force(default_conf, caplog) -> None:
 
 
 def test__validate_order_types(default_conf, caplog) -> None:
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['order_types'] = {
         'buy': 'limit',
         'sell': 'market',
@@ -1011,7 +986,7 @@ def test__validate_order_types(default_conf, caplog) -> None:
     assert 'forcebuy' not in conf['order_types']
     assert 'forcesell' not in conf['order_types']
 
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['order_types'] = {
         'buy': 'limit',
         'sell': 'market',
@@ -1027,7 +1002,7 @@ def test__validate_order_types(default_conf, caplog) -> None:
 
 
 def test__validate_unfilledtimeout(default_conf, caplog) -> None:
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['unfilledtimeout'] = {
         'buy': 30,
         'sell': 35,
@@ -1039,7 +1014,7 @@ def test__validate_unfilledtimeout(default_conf, caplog) -> None:
     assert 'buy' not in conf['unfilledtimeout']
     assert 'sell' not in conf['unfilledtimeout']
 
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['unfilledtimeout'] = {
         'buy': 30,
         'sell': 35,
@@ -1052,7 +1027,7 @@ def test__validate_unfilledtimeout(default_conf, caplog) -> None:
 
 
 def test__validate_pricing_rules(default_conf, caplog) -> None:
-    def_conf = deepcopy(default_conf)
+    def_conf = clone_conf(default_conf)
     del def_conf['entry_pricing']
     del def_conf['exit_pricing']
 
@@ -1066,7 +1041,7 @@ def test__validate_pricing_rules(default_conf, caplog) -> None:
         'use_order_book': False,
         'ask_last_balance': 0.7
     }
-    conf = deepcopy(def_conf)
+    conf = clone_conf(def_conf)
 
     validate_config_consistency(conf)
     assert log_has_re(
@@ -1080,7 +1055,7 @@ def test__validate_pricing_rules(default_conf, caplog) -> None:
     assert 'ask_strategy' not in conf
     assert 'bid_strategy' not in conf
 
-    conf = deepcopy(def_conf)
+    conf = clone_conf(def_conf)
 
     conf['trading_mode'] = 'futures'
     with pytest.raises(
@@ -1465,7 +1440,7 @@ def test_process_removed_setting(mocker, default_conf, caplog):
 
 def test_process_deprecated_ticker_interval(default_conf, caplog):
     message = "DEPRECATED: Please use 'timeframe' instead of 'ticker_interval."
-    config = deepcopy(default_conf)
+    config = clone_conf(default_conf)
 
     process_temporary_deprecated_settings(config)
     assert not log_has(message, caplog)
@@ -1479,7 +1454,7 @@ def test_process_deprecated_ticker_interval(default_conf, caplog):
 
 def test_process_deprecated_protections(default_conf, caplog):
     message = "DEPRECATED: Setting 'protections' in the configuration is deprecated."
-    config = deepcopy(default_conf)
+    config = clone_conf(default_conf)
     process_temporary_deprecated_settings(config)
     assert not log_has(message, caplog)
 
@@ -4,6 +4,7 @@
 import logging
 import time
 from copy import deepcopy
+from datetime import datetime, timedelta, timezone
 from math import isclose
 from typing import List
 from unittest.mock import ANY, MagicMock, PropertyMock, patch
@@ -23,9 +24,10 @@ from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.persistence.models import PairLock
 from freqtrade.plugins.protections.iprotection import ProtectionReturn
 from freqtrade.worker import Worker
-from tests.conftest import (create_mock_trades, get_patched_freqtradebot, get_patched_worker,
-                            log_has, log_has_re, patch_edge, patch_exchange, patch_get_signal,
-                            patch_wallet, patch_whitelist)
+from tests.conftest import (clone_conf, create_mock_trades, get_patched_freqtradebot,
+                            get_patched_worker, log_has, log_has_re, log_in, log_messages,
+                            patch_edge, patch_exchange, patch_get_signal, patch_wallet,
+                            patch_whitelist)
 from tests.conftest_trades import (MOCK_TRADE_COUNT, entry_side, exit_side, mock_order_1,
                                    mock_order_2, mock_order_2_sell, mock_order_3, mock_order_3_sell,
                                    mock_order_4, mock_order_5_stoploss, mock_order_6_sell)
@@ -144,9 +146,8 @@ def test_check_available_stake_amount(
     amend_last, wallet, max_open, lsamr, expected
 ) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(return_value=limit_buy_order_usdt_open),
         get_fee=fee
@@ -201,7 +202,6 @@ def test_edge_overrides_stake_amount(mocker, edge_conf) -> None:
 def test_edge_overrides_stoploss(limit_order, fee, caplog, mocker,
                                  buy_price_mult, ignore_strat_sl, edge_conf) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     patch_edge(mocker)
     edge_conf['max_open_trades'] = float('inf')
 
@@ -215,8 +215,8 @@ def test_edge_overrides_stoploss(limit_order, fee, caplog, mocker,
             'ask': enter_price,
             'last': enter_price,
         }
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value=ticker_val),
         get_fee=fee,
     )
@@ -248,10 +248,9 @@ def test_edge_overrides_stoploss(limit_order, fee, caplog, mocker,
 
 def test_total_open_trades_stakes(mocker, default_conf_usdt, ticker_usdt, fee) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     default_conf_usdt['max_open_trades'] = 2
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
         _is_dry_limit_order_filled=MagicMock(return_value=False),
@@ -284,16 +283,15 @@ def test_total_open_trades_stakes(mocker, default_conf_usdt, ticker_usdt, fee) -
 def test_create_trade(default_conf_usdt, ticker_usdt, limit_order,
                       fee, mocker, is_short, open_rate) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
         _is_dry_limit_order_filled=MagicMock(return_value=False),
     )
 
     # Save state of current whitelist
-    whitelist = deepcopy(default_conf_usdt['exchange']['pair_whitelist'])
+    whitelist = list(default_conf_usdt['exchange']['pair_whitelist'])
     freqtrade = FreqtradeBot(default_conf_usdt)
     patch_get_signal(freqtrade, enter_short=is_short, enter_long=not is_short)
     freqtrade.create_trade('ETH/USDT')
@@ -319,10 +317,9 @@ def test_create_trade(default_conf_usdt, ticker_usdt, limit_order,
 
 def test_create_trade_no_stake_amount(default_conf_usdt, ticker_usdt, fee, mocker) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     patch_wallet(mocker, free=default_conf_usdt['stake_amount'] * 0.5)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
     )
@@ -345,10 +342,9 @@ def test_create_trade_minimal_amount(
     stake_amount, create, amount_enough, max_open_trades, caplog, is_short
 ) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     enter_mock = MagicMock(return_value=limit_order_open[entry_side(is_short)])
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=enter_mock,
         get_fee=fee,
@@ -381,9 +377,8 @@ def test_create_trade_minimal_amount(
 def test_enter_positions_no_pairs_left(default_conf_usdt, ticker_usdt, limit_buy_order_usdt_open,
                                        fee, whitelist, positions, mocker, caplog) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(return_value=limit_buy_order_usdt_open),
         get_fee=fee,
@@ -408,9 +403,8 @@ def test_enter_positions_no_pairs_left(default_conf_usdt, ticker_usdt, limit_buy
 def test_enter_positions_global_pairlock(default_conf_usdt, ticker_usdt, limit_buy_order_usdt, fee,
                                          mocker, caplog) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(return_value={'id': limit_buy_order_usdt['id']}),
         get_fee=fee,
@@ -425,7 +419,8 @@ def test_enter_positions_global_pairlock(default_conf_usdt, ticker_usdt, limit_b
     assert not log_has_re(message, caplog)
     caplog.clear()
 
-    PairLocks.lock_pair('*', arrow.utcnow().shift(minutes=20).datetime, 'Just because', side='*')
+    PairLocks.lock_pair('*', datetime.now(timezone.utc) + timedelta(minutes=20), 'Just because',
+                        side='*')
     n = freqtrade.enter_positions()
     assert n == 0
     assert log_has_re(message, caplog)
@@ -446,7 +441,8 @@ def test_handle_protections(mocker, default_conf_usdt, fee, is_short):
 
     freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
     freqtrade.protections._protection_handlers[1].global_stop = MagicMock(
-        return_value=ProtectionReturn(True, arrow.utcnow().shift(hours=1).datetime, "asdf"))
+        return_value=ProtectionReturn(
+            True, datetime.now(timezone.utc) + timedelta(hours=1), "asdf"))
     create_mock_trades(fee, is_short)
     freqtrade.handle_protections('ETC/BTC', '*')
     send_msg_mock = freqtrade.rpc.send_msg
@@ -459,17 +455,15 @@ def test_create_trade_no_signal(default_conf_usdt, fee, mocker) -> None:
     default_conf_usdt['dry_run'] = True
 
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         get_fee=fee,
     )
     default_conf_usdt['stake_amount'] = 10
     freqtrade = FreqtradeBot(default_conf_usdt)
     patch_get_signal(freqtrade, enter_long=False, exit_long=False)
 
-    Trade.query = MagicMock()
-    Trade.query.filter = MagicMock()
+    mocker.patch.object(Trade, 'query')
     assert not freqtrade.create_trade('ETH/USDT')
 
 
@@ -480,13 +474,12 @@ def test_create_trades_multiple_trades(
     max_open, tradable_balance_ratio, modifier
 ) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     default_conf_usdt['max_open_trades'] = max_open
     default_conf_usdt['tradable_balance_ratio'] = tradable_balance_ratio
     default_conf_usdt['dry_run_wallet'] = 60.0 * max_open
 
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(return_value=limit_buy_order_usdt_open),
         get_fee=fee,
@@ -505,10 +498,9 @@ def test_create_trades_multiple_trades(
 def test_create_trades_preopen(default_conf_usdt, ticker_usdt, fee, mocker,
                                limit_buy_order_usdt_open) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     default_conf_usdt['max_open_trades'] = 4
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(return_value=limit_buy_order_usdt_open),
         get_fee=fee,
@@ -538,9 +530,8 @@ def test_process_trade_creation(default_conf_usdt, ticker_usdt, limit_order, lim
                                 ) -> None:
     ticker_side = 'ask' if is_short else 'bid'
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(return_value=limit_order_open[entry_side(is_short)]),
         fetch_order=MagicMock(return_value=limit_order[entry_side(is_short)]),
@@ -574,9 +565,8 @@ def test_process_trade_creation(default_conf_usdt, ticker_usdt, limit_order, lim
 
 def test_process_exchange_failures(default_conf_usdt, ticker_usdt, mocker) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(side_effect=TemporaryError)
     )
@@ -591,9 +581,8 @@ def test_process_exchange_failures(default_conf_usdt, ticker_usdt, mocker) -> No
 
 def test_process_operational_exception(default_conf_usdt, ticker_usdt, mocker) -> None:
     msg_mock = patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(side_effect=OperationalException)
     )
@@ -610,9 +599,8 @@ def test_process_operational_exception(default_conf_usdt, ticker_usdt, mocker) -
 def test_process_trade_handling(default_conf_usdt, ticker_usdt, limit_buy_order_usdt_open, fee,
                                 mocker) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(return_value=limit_buy_order_usdt_open),
         fetch_order=MagicMock(return_value=limit_buy_order_usdt_open),
@@ -637,9 +625,8 @@ def test_process_trade_no_whitelist_pair(default_conf_usdt, ticker_usdt, limit_b
                                          fee, mocker) -> None:
     """ Test process with trade not in pair list """
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(return_value={'id': limit_buy_order_usdt['id']}),
         fetch_order=MagicMock(return_value=limit_buy_order_usdt),
@@ -682,11 +669,10 @@ def test_process_trade_no_whitelist_pair(default_conf_usdt, ticker_usdt, limit_b
 
 def test_process_informative_pairs_added(default_conf_usdt, ticker_usdt, mocker) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
 
     refresh_mock = MagicMock()
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(side_effect=TemporaryError),
         refresh_latest_ohlcv=refresh_mock,
@@ -1068,9 +1054,8 @@ def test_handle_stoploss_on_exchange(mocker, default_conf_usdt, fee, caplog, is_
     enter_order = limit_order[entry_side(is_short)]
     exit_order = limit_order[exit_side(is_short)]
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': 1.9,
             'ask': 2.2,
@@ -1201,7 +1186,7 @@ def test_handle_stoploss_on_exchange(mocker, default_conf_usdt, fee, caplog, is_
     }])
     trade.stoploss_order_id = 100
     trade.is_open = True
-    trade.stoploss_last_update = arrow.utcnow().shift(hours=-1).datetime
+    trade.stoploss_last_update = datetime.now(timezone.utc) - timedelta(hours=1)
     trade.stop_loss = 24
     freqtrade.config['trailing_stop'] = True
     stoploss = MagicMock(side_effect=InvalidOrderException())
@@ -1223,9 +1208,8 @@ def test_handle_sle_cancel_cant_recreate(mocker, default_conf_usdt, fee, caplog,
     enter_order = limit_order[entry_side(is_short)]
     exit_order = limit_order[exit_side(is_short)]
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': 1.9,
             'ask': 2.2,
@@ -1266,13 +1250,12 @@ def test_create_stoploss_order_invalid_order(
     open_order = limit_order_open[entry_side(is_short)]
     order = limit_order[exit_side(is_short)]
     rpc_mock = patch_RPCManager(mocker)
-    patch_exchange(mocker)
     create_order_mock = MagicMock(side_effect=[
         open_order,
         {'id': order['id']}
     ])
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': 1.9,
             'ask': 2.2,
@@ -1492,10 +1475,9 @@ def test_handle_stoploss_on_exchange_trailing_error(
     exit_order = limit_order[exit_side(is_short)]
     # When trailing stoploss is set
     stoploss = MagicMock(return_value={'id': 13434334})
-    patch_exchange(mocker)
 
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': 1.9,
             'ask': 2.2,
@@ -1533,7 +1515,7 @@ def test_handle_stoploss_on_exchange_trailing_error(
     trade.open_order_id = None
     trade.stoploss_order_id = "abcd"
     trade.stop_loss = 0.2
-    trade.stoploss_last_update = arrow.utcnow().shift(minutes=-601).datetime.replace(tzinfo=None)
+    trade.stoploss_last_update = datetime.utcnow() - timedelta(minutes=601)
     trade.is_short = is_short
 
     stoploss_order_hanging = {
@@ -1924,7 +1906,7 @@ def test_update_trade_state(mocker, default_conf_usdt, limit_order, is_short, ca
         fee_open=0.001,
         fee_close=0.001,
         open_rate=0.01,
-        open_date=arrow.utcnow().datetime,
+        open_date=datetime.now(timezone.utc),
         amount=11,
         exchange="binance",
         is_short=is_short,
@@ -1997,7 +1979,7 @@ def test_update_trade_state_withorderdict(
         amount=amount,
         exchange='binance',
         open_rate=2.0,
-        open_date=arrow.utcnow().datetime,
+        open_date=datetime.now(timezone.utc),
         fee_open=fee.return_value,
         fee_close=fee.return_value,
         open_order_id=order_id,
@@ -2082,7 +2064,7 @@ def test_update_trade_state_sell(
         open_rate=0.245441,
         fee_open=0.0025,
         fee_close=0.0025,
-        open_date=arrow.utcnow().datetime,
+        open_date=datetime.now(timezone.utc),
         open_order_id=open_order['id'],
         is_open=True,
         interest_rate=0.0005,
@@ -2115,9 +2097,8 @@ def test_handle_trade(
     enter_order = limit_order[entry_side(is_short)]
     exit_order = limit_order[exit_side(is_short)]
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': 2.19,
             'ask': 2.2,
@@ -2168,9 +2149,8 @@ def test_handle_overlapping_signals(
 ) -> None:
     open_order = limit_order_open[exit_side(is_short)]
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(side_effect=[
             open_order,
@@ -2329,9 +2309,8 @@ def test_close_trade(
     enter_order = limit_order[exit_side(is_short)]
     exit_order = limit_order[entry_side(is_short)]
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(return_value=open_order),
         get_fee=fee,
@@ -2386,9 +2365,8 @@ def test_manage_open_orders_entry_usercustom(
     cancel_enter_order['status'] = 'canceled'
     cancel_order_wr_mock = MagicMock(return_value=cancel_enter_order)
 
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         fetch_order=MagicMock(return_value=old_order),
         cancel_order_with_result=cancel_order_wr_mock,
@@ -2409,7 +2387,7 @@ def test_manage_open_orders_entry_usercustom(
     freqtrade.strategy.check_entry_timeout = MagicMock(return_value=False)
     freqtrade.manage_open_orders()
     assert cancel_order_mock.call_count == 0
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     nb_trades = len(trades)
     assert nb_trades == 1
     assert freqtrade.strategy.check_entry_timeout.call_count == 1
@@ -2417,7 +2395,7 @@ def test_manage_open_orders_entry_usercustom(
 
     freqtrade.manage_open_orders()
     assert cancel_order_mock.call_count == 0
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     nb_trades = len(trades)
     assert nb_trades == 1
     assert freqtrade.strategy.check_entry_timeout.call_count == 1
@@ -2427,7 +2405,7 @@ def test_manage_open_orders_entry_usercustom(
     freqtrade.manage_open_orders()
     assert cancel_order_wr_mock.call_count == 1
     assert rpc_mock.call_count == 1
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     nb_trades = len(trades)
     assert nb_trades == 0
     assert freqtrade.strategy.check_entry_timeout.call_count == 1
@@ -2444,9 +2422,8 @@ def test_manage_open_orders_entry(
     limit_buy_cancel = deepcopy(old_order)
     limit_buy_cancel['status'] = 'canceled'
     cancel_order_mock = MagicMock(return_value=limit_buy_cancel)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         fetch_order=MagicMock(return_value=old_order),
         cancel_order_with_result=cancel_order_mock,
@@ -2463,7 +2440,7 @@ def test_manage_open_orders_entry(
     freqtrade.manage_open_orders()
     assert cancel_order_mock.call_count == 1
     assert rpc_mock.call_count == 1
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     nb_trades = len(trades)
     assert nb_trades == 0
     # Custom user buy-timeout is never called
@@ -2500,7 +2477,7 @@ def test_adjust_entry_cancel(
     # check that order is cancelled
     freqtrade.strategy.adjust_entry_price = MagicMock(return_value=None)
     freqtrade.manage_open_orders()
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     assert len(trades) == 0
     assert len(Order.query.all()) == 0
     assert log_has_re(
@@ -2540,7 +2517,7 @@ def test_adjust_entry_maintain_replace(
     # Check that order is maintained
     freqtrade.strategy.adjust_entry_price = MagicMock(return_value=old_order['price'])
     freqtrade.manage_open_orders()
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     assert len(trades) == 1
     assert len(Order.get_open_orders()) == 1
     # Entry adjustment is called
@@ -2550,7 +2527,7 @@ def test_adjust_entry_maintain_replace(
     freqtrade.get_valid_enter_price_and_stake = MagicMock(return_value={100, 10, 1})
     freqtrade.strategy.adjust_entry_price = MagicMock(return_value=1234)
     freqtrade.manage_open_orders()
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     assert len(trades) == 1
     nb_all_orders = len(Order.query.all())
     assert nb_all_orders == 2
@@ -2572,10 +2549,9 @@ def test_check_handle_cancelled_buy(
     old_order = limit_sell_order_old if is_short else limit_buy_order_old
     rpc_mock = patch_RPCManager(mocker)
     cancel_order_mock = MagicMock()
-    patch_exchange(mocker)
     old_order.update({"status": "canceled", 'filled': 0.0})
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         fetch_order=MagicMock(return_value=old_order),
         cancel_order=cancel_order_mock,
@@ -2590,7 +2566,7 @@ def test_check_handle_cancelled_buy(
     freqtrade.manage_open_orders()
     assert cancel_order_mock.call_count == 0
     assert rpc_mock.call_count == 1
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     assert len(trades) == 0
     assert log_has_re(
         f"{'Sell' if is_short else 'Buy'} order cancelled on exchange for Trade.*", caplog)
@@ -2602,10 +2578,8 @@ def test_manage_open_orders_buy_exception(
 ) -> None:
     rpc_mock = patch_RPCManager(mocker)
     cancel_order_mock = MagicMock()
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
-        validate_pairs=MagicMock(),
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         fetch_order=MagicMock(side_effect=ExchangeError),
         cancel_order=cancel_order_mock,
@@ -2620,7 +2594,7 @@ def test_manage_open_orders_buy_exception(
     freqtrade.manage_open_orders()
     assert cancel_order_mock.call_count == 0
     assert rpc_mock.call_count == 0
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     nb_trades = len(trades)
     assert nb_trades == 1
 
@@ -2648,8 +2622,8 @@ def test_manage_open_orders_exit_usercustom(
     )
     freqtrade = FreqtradeBot(default_conf_usdt)
 
-    open_trade_usdt.open_date = arrow.utcnow().shift(hours=-5).datetime
-    open_trade_usdt.close_date = arrow.utcnow().shift(minutes=-601).datetime
+    open_trade_usdt.open_date = datetime.now(timezone.utc) - timedelta(hours=5)
+    open_trade_usdt.close_date = datetime.now(timezone.utc) - timedelta(minutes=601)
     open_trade_usdt.close_profit_abs = 0.001
     open_trade_usdt.is_open = False
 
@@ -2720,17 +2694,16 @@ def test_manage_open_orders_exit(
     cancel_order_mock = MagicMock()
     limit_sell_order_old['id'] = open_trade_usdt.open_order_id
     limit_sell_order_old['side'] = 'buy' if is_short else 'sell'
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         fetch_order=MagicMock(return_value=limit_sell_order_old),
         cancel_order=cancel_order_mock
     )
     freqtrade = FreqtradeBot(default_conf_usdt)
 
-    open_trade_usdt.open_date = arrow.utcnow().shift(hours=-5).datetime
-    open_trade_usdt.close_date = arrow.utcnow().shift(minutes=-601).datetime
+    open_trade_usdt.open_date = datetime.now(timezone.utc) - timedelta(hours=5)
+    open_trade_usdt.close_date = datetime.now(timezone.utc) - timedelta(minutes=601)
     open_trade_usdt.close_profit_abs = 0.001
     open_trade_usdt.is_open = False
     open_trade_usdt.is_short = is_short
@@ -2761,17 +2734,16 @@ def test_check_handle_cancelled_exit(
     limit_sell_order_old['side'] = 'buy' if is_short else 'sell'
     limit_sell_order_old['id'] = open_trade_usdt.open_order_id
 
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         fetch_order=MagicMock(return_value=limit_sell_order_old),
         cancel_order_with_result=cancel_order_mock
     )
     freqtrade = FreqtradeBot(default_conf_usdt)
 
-    open_trade_usdt.open_date = arrow.utcnow().shift(hours=-5).datetime
-    open_trade_usdt.close_date = arrow.utcnow().shift(minutes=-601).datetime
+    open_trade_usdt.open_date = datetime.now(timezone.utc) - timedelta(hours=5)
+    open_trade_usdt.close_date = datetime.now(timezone.utc) - timedelta(minutes=601)
     open_trade_usdt.is_open = False
     open_trade_usdt.is_short = is_short
 
@@ -2802,9 +2774,8 @@ def test_manage_open_orders_partial(
     limit_buy_canceled['status'] = 'canceled'
 
     cancel_order_mock = MagicMock(return_value=limit_buy_canceled)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         fetch_order=MagicMock(return_value=limit_buy_order_old_partial),
         cancel_order_with_result=cancel_order_mock
@@ -2818,7 +2789,7 @@ def test_manage_open_orders_partial(
     freqtrade.manage_open_orders()
     assert cancel_order_mock.call_count == 1
     assert rpc_mock.call_count == 2
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     assert len(trades) == 1
     assert trades[0].amount == 23.0
     assert trades[0].stake_amount == open_trade.open_rate * trades[0].amount / leverage
@@ -2841,9 +2812,8 @@ def test_manage_open_orders_partial_fee(
 
     cancel_order_mock = MagicMock(return_value=limit_buy_order_old_partial_canceled)
     mocker.patch('freqtrade.wallets.Wallets.get_free', MagicMock(return_value=0))
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         fetch_order=MagicMock(return_value=limit_buy_order_old_partial),
         cancel_order_with_result=cancel_order_mock,
@@ -2864,7 +2834,7 @@ def test_manage_open_orders_partial_fee(
 
     assert cancel_order_mock.call_count == 1
     assert rpc_mock.call_count == 2
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     assert len(trades) == 1
     # Verify that trade has been updated
     assert trades[0].amount == (limit_buy_order_old_partial['amount'] -
@@ -2888,9 +2858,8 @@ def test_manage_open_orders_partial_except(
     if is_short:
         limit_buy_order_old_partial['side'] = 'sell'
     cancel_order_mock = MagicMock(return_value=limit_buy_order_old_partial_canceled)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         fetch_order=MagicMock(return_value=limit_buy_order_old_partial),
         cancel_order_with_result=cancel_order_mock,
@@ -2913,7 +2882,7 @@ def test_manage_open_orders_partial_except(
 
     assert cancel_order_mock.call_count == 1
     assert rpc_mock.call_count == 2
-    trades = Trade.query.filter(Trade.open_order_id.is_(open_trade.open_order_id)).all()
+    trades = Trade.query.filter(Trade.open_order_id == open_trade.open_order_id).all()
     assert len(trades) == 1
     # Verify that trade has been updated
 
@@ -3045,11 +3014,10 @@ def test_handle_cancel_enter_exchanges(mocker, caplog, default_conf_usdt, is_sho
 def test_handle_cancel_enter_corder_empty(mocker, default_conf_usdt, limit_order, is_short,
                                           cancelorder) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     l_order = limit_order[entry_side(is_short)]
     cancel_order_mock = MagicMock(return_value=cancelorder)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         cancel_order=cancel_order_mock
     )
 
@@ -3077,10 +3045,9 @@ def test_handle_cancel_enter_corder_empty(mocker, default_conf_usdt, limit_order
 
 def test_handle_cancel_exit_limit(mocker, default_conf_usdt, fee) -> None:
     send_msg_mock = patch_RPCManager(mocker)
-    patch_exchange(mocker)
     cancel_order_mock = MagicMock()
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         cancel_order=cancel_order_mock,
     )
     mocker.patch('freqtrade.exchange.Exchange.get_rate', return_value=0.245441)
@@ -3093,11 +3060,11 @@ def test_handle_cancel_exit_limit(mocker, default_conf_usdt, fee) -> None:
         exchange='binance',
         open_rate=0.245441,
         open_order_id="123456",
-        open_date=arrow.utcnow().shift(days=-2).datetime,
+        open_date=datetime.now(timezone.utc) - timedelta(days=2),
         fee_open=fee.return_value,
         fee_close=fee.return_value,
         close_rate=0.555,
-        close_date=arrow.utcnow().datetime,
+        close_date=datetime.now(timezone.utc),
         exit_reason="sell_reason_whatever",
     )
     trade.orders = [
@@ -3172,9 +3139,8 @@ def test_handle_cancel_exit_cancel_exception(mocker, default_conf_usdt) -> None:
 def test_execute_trade_exit_up(default_conf_usdt, ticker_usdt, fee, ticker_usdt_sell_up, mocker,
                                ticker_usdt_sell_down, is_short, open_rate, amt) -> None:
     rpc_mock = patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
         _is_dry_limit_order_filled=MagicMock(return_value=False),
@@ -3251,9 +3217,8 @@ def test_execute_trade_exit_up(default_conf_usdt, ticker_usdt, fee, ticker_usdt_
 def test_execute_trade_exit_down(default_conf_usdt, ticker_usdt, fee, ticker_usdt_sell_down,
                                  ticker_usdt_sell_up, mocker, is_short) -> None:
     rpc_mock = patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
         _is_dry_limit_order_filled=MagicMock(return_value=False),
@@ -3316,14 +3281,13 @@ def test_execute_trade_exit_custom_exit_price(
         default_conf_usdt, ticker_usdt, fee, ticker_usdt_sell_up, is_short, amount, open_rate,
         current_rate, limit, profit_amount, profit_ratio, profit_or_loss, mocker) -> None:
     rpc_mock = patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
         _is_dry_limit_order_filled=MagicMock(return_value=False),
     )
-    config = deepcopy(default_conf_usdt)
+    config = clone_conf(default_conf_usdt)
     config['custom_price_max_distance_ratio'] = 0.1
     patch_whitelist(mocker, config)
     freqtrade = FreqtradeBot(config)
@@ -3393,9 +3357,8 @@ def test_execute_trade_exit_down_stoploss_on_exchange_dry_run(
         default_conf_usdt, ticker_usdt, fee, is_short, ticker_usdt_sell_down,
         ticker_usdt_sell_up, mocker) -> None:
     rpc_mock = patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
         _is_dry_limit_order_filled=MagicMock(return_value=False),
@@ -3466,9 +3429,8 @@ def test_execute_trade_exit_sloe_cancel_exception(
         {'id': '12345554'},
         {'id': '12345555'},
     ])
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
         create_order=create_order_mock,
@@ -3496,7 +3458,6 @@ def test_execute_trade_exit_with_stoploss_on_exchange(
 
     default_conf_usdt['exchange']['name'] = 'binance'
     rpc_mock = patch_RPCManager(mocker)
-    patch_exchange(mocker)
     stoploss = MagicMock(return_value={
         'id': 123,
         'info': {
@@ -3505,8 +3466,8 @@ def test_execute_trade_exit_with_stoploss_on_exchange(
     })
 
     cancel_order = MagicMock(return_value=True)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
         amount_to_precision=lambda s, x, y: y,
@@ -3555,9 +3516,8 @@ def test_may_execute_trade_exit_after_stoploss_on_exchange_hit(
         default_conf_usdt, ticker_usdt, fee, mocker, is_short) -> None:
     default_conf_usdt['exchange']['name'] = 'binance'
     rpc_mock = patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
         amount_to_precision=lambda s, x, y: y,
@@ -3651,9 +3611,8 @@ def test_execute_trade_exit_market_order(
     """
     open_rate = ticker_usdt.return_value['ask' if is_short else 'bid']
     rpc_mock = patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
         _is_dry_limit_order_filled=MagicMock(return_value=True),
@@ -3773,10 +3732,9 @@ def test_exit_profit_only(
         default_conf_usdt, limit_order, limit_order_open, is_short,
         fee, mocker, profit_only, bid, ask, handle_first, handle_second, exit_type) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     eside = entry_side(is_short)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': bid,
             'ask': ask,
@@ -3825,9 +3783,8 @@ def test_exit_profit_only(
 def test_sell_not_enough_balance(default_conf_usdt, limit_order, limit_order_open,
                                  fee, mocker, caplog) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': 0.00002172,
             'ask': 0.00002173,
@@ -3900,9 +3857,8 @@ def test__safe_exit_amount(default_conf_usdt, fee, caplog, mocker, amount_wallet
 def test_locked_pairs(default_conf_usdt, ticker_usdt, fee,
                       ticker_usdt_sell_down, mocker, caplog, is_short) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         get_fee=fee,
     )
@@ -3944,10 +3900,9 @@ def test_locked_pairs(default_conf_usdt, ticker_usdt, fee,
 def test_ignore_roi_if_entry_signal(default_conf_usdt, limit_order, limit_order_open, is_short,
                                     fee, mocker) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     eside = entry_side(is_short)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': 2.19,
             'ask': 2.2,
@@ -3996,9 +3951,8 @@ def test_ignore_roi_if_entry_signal(default_conf_usdt, limit_order, limit_order_
 def test_trailing_stop_loss(default_conf_usdt, limit_order_open,
                             is_short, val1, val2, fee, caplog, mocker) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': 2.0,
             'ask': 2.0,
@@ -4065,10 +4019,9 @@ def test_trailing_stop_loss_positive(
 ) -> None:
     enter_price = limit_order[entry_side(is_short)]['price']
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     eside = entry_side(is_short)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': enter_price - (-0.01 if is_short else 0.01),
             'ask': enter_price - (-0.01 if is_short else 0.01),
@@ -4114,12 +4067,13 @@ def test_trailing_stop_loss_positive(
     assert freqtrade.handle_trade(trade) is False
     caplog_text = (f"ETH/USDT - Using positive stoploss: 0.01 offset: {offset} profit: "
                    f"{'2.49' if not is_short else '2.24'}%")
+    logs = log_messages(caplog)
     if trail_if_reached:
-        assert not log_has(caplog_text, caplog)
-        assert not log_has("ETH/USDT - Adjusting stoploss...", caplog)
+        assert not log_in(caplog_text, logs)
+        assert not log_in("ETH/USDT - Adjusting stoploss...", logs)
     else:
-        assert log_has(caplog_text, caplog)
-        assert log_has("ETH/USDT - Adjusting stoploss...", caplog)
+        assert log_in(caplog_text, logs)
+        assert log_in("ETH/USDT - Adjusting stoploss...", logs)
     assert pytest.approx(trade.stop_loss) == second_sl
     caplog.clear()
 
@@ -4132,12 +4086,13 @@ def test_trailing_stop_loss_positive(
         })
     )
     assert freqtrade.handle_trade(trade) is False
-    assert log_has(
+    logs = log_messages(caplog)
+    assert log_in(
         f"ETH/USDT - Using positive stoploss: 0.01 offset: {offset} profit: "
         f"{'5.72' if not is_short else '5.67'}%",
-        caplog
+        logs
     )
-    assert log_has("ETH/USDT - Adjusting stoploss...", caplog)
+    assert log_in("ETH/USDT - Adjusting stoploss...", logs)
 
     mocker.patch(
         'freqtrade.exchange.Exchange.fetch_ticker',
@@ -4162,10 +4117,9 @@ def test_trailing_stop_loss_positive(
 def test_disable_ignore_roi_if_entry_signal(default_conf_usdt, limit_order, limit_order_open,
                                             is_short, fee, mocker) -> None:
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
     eside = entry_side(is_short)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': 2.0,
             'ask': 2.0,
@@ -4204,12 +4158,10 @@ def test_disable_ignore_roi_if_entry_signal(default_conf_usdt, limit_order, limi
     assert trade.exit_reason == ExitType.ROI.value
 
 
-def test_get_real_amount_quote(default_conf_usdt, trades_for_order, buy_order_fee, fee, caplog,
-                               mocker):
-    mocker.patch('freqtrade.exchange.Exchange.get_trades_for_order', return_value=trades_for_order)
-    amount = sum(x['amount'] for x in trades_for_order)
-    trade = Trade(
-        pair='LTC/ETH',
+def real_amount_trade(amount, fee, pair='LTC/ETH') -> Trade:
+    """Trade as used by the get_real_amount tests - only amount and pair differ between them."""
+    return Trade(
+        pair=pair,
         amount=amount,
         exchange='binance',
         open_rate=0.245441,
@@ -4217,34 +4169,53 @@ def test_get_real_amount_quote(default_conf_usdt, trades_for_order, buy_order_fe
         fee_close=fee.return_value,
         open_order_id="123456"
     )
+
+
+@pytest.mark.parametrize('use_trades,order_fee,fee_reduction_amount,expected_log', [
+    # fee in base currency from the trades - amount is reduced by "fee"
+    pytest.param(True, None, 0.008, (
+        'Applying fee on amount for Trade(id=None, pair=LTC/ETH, amount=8.00000000, '
+        'is_short=False, leverage=1.0, open_rate=0.24544100, open_since=closed) '
+        '(from 8.0 to 7.992).'
+    ), id='quote'),
+    # no trades - amount does not change
+    pytest.param(False, None, 0, (
+        'Applying fee on amount for Trade(id=None, pair=LTC/ETH, amount=8.00000000, '
+        'is_short=False, leverage=1.0, open_rate=0.24544100, open_since=closed) failed: '
+        'myTrade-Dict empty found'
+    ), id='no_trade'),
+    # invalid order fee (no currency) and no trades - amount does not change
+    pytest.param(False, {'cost': 0.004}, 0, None, id='invalid_order'),
+])
+def test_get_real_amount_trades(default_conf_usdt, trades_for_order, buy_order_fee, fee, caplog,
+                                mocker, use_trades, order_fee, fee_reduction_amount,
+                                expected_log):
+    buy_order = buy_order_fee.copy()
+    buy_order['fee'] = order_fee
+
+    mocker.patch('freqtrade.exchange.Exchange.get_trades_for_order',
+                 return_value=trades_for_order if use_trades else [])
+    amount = sum(x['amount'] for x in trades_for_order)
+    trade = real_amount_trade(amount, fee)
     freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
 
     caplog.clear()
     order_obj = Order.parse_from_ccxt_object(buy_order_fee, 'LTC/ETH', 'buy')
-    # Amount is reduced by "fee"
-    assert freqtrade.get_real_amount(trade, buy_order_fee, order_obj) == amount - (amount * 0.001)
-    assert log_has(
-        'Applying fee on amount for Trade(id=None, pair=LTC/ETH, amount=8.00000000, is_short=False,'
-        ' leverage=1.0, open_rate=0.24544100, open_since=closed) (from 8.0 to 7.992).',
-        caplog
-    )
+    assert freqtrade.get_real_amount(trade, buy_order, order_obj) == pytest.approx(
+        amount - fee_reduction_amount)
+    if expected_log:
+        assert log_has(expected_log, caplog)
 
 
 def test_get_real_amount_quote_dust(default_conf_usdt, trades_for_order, buy_order_fee, fee,
                                     caplog, mocker):
     mocker.patch('freqtrade.exchange.Exchange.get_trades_for_order', return_value=trades_for_order)
-    walletmock = mocker.patch('freqtrade.wallets.Wallets.update')
-    mocker.patch('freqtrade.wallets.Wallets.get_free', return_value=8.1122)
+    walletmock = MagicMock()
+    mocker.patch.multiple('freqtrade.wallets.Wallets',
+                          update=walletmock,
+                          get_free=MagicMock(return_value=8.1122))
     amount = sum(x['amount'] for x in trades_for_order)
-    trade = Trade(
-        pair='LTC/ETH',
-        amount=amount,
-        exchange='binance',
-        open_rate=0.245441,
-        fee_open=fee.return_value,
-        fee_close=fee.return_value,
-        open_order_id="123456"
-    )
+    trade = real_amount_trade(amount, fee)
     freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
 
     walletmock.reset_mock()
@@ -4256,32 +4227,6 @@ def test_get_real_amount_quote_dust(default_conf_usdt, trades_for_order, buy_ord
                       '- Eating Fee 0.008 into dust', caplog)
 
 
-def test_get_real_amount_no_trade(default_conf_usdt, buy_order_fee, caplog, mocker, fee):
-    mocker.patch('freqtrade.exchange.Exchange.get_trades_for_order', return_value=[])
-
-    amount = buy_order_fee['amount']
-    trade = Trade(
-        pair='LTC/ETH',
-        amount=amount,
-        exchange='binance',
-        open_rate=0.245441,
-        fee_open=fee.return_value,
-        fee_close=fee.return_value,
-        open_order_id="123456"
-    )
-    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
-
-    order_obj = Order.parse_from_ccxt_object(buy_order_fee, 'LTC/ETH', 'buy')
-    # Amount is reduced by "fee"
-    assert freqtrade.get_real_amount(trade, buy_order_fee, order_obj) == amount
-    assert log_has(
-        'Applying fee on amount for Trade(id=None, pair=LTC/ETH, amount=8.00000000, '
-        'is_short=False, leverage=1.0, open_rate=0.24544100, open_since=closed) failed: '
-        'myTrade-Dict empty found',
-        caplog
-    )
-
-
 @pytest.mark.parametrize(
     'fee_par,fee_reduction_amount,use_ticker_usdt_rate,expected_log', [
         # basic, amount does not change
@@ -4308,21 +4253,13 @@ def test_get_real_amount(
     fee_par, fee_reduction_amount, use_ticker_usdt_rate, expected_log
 ):
 
-    buy_order = deepcopy(buy_order_fee)
+    buy_order = buy_order_fee.copy()
     buy_order['fee'] = fee_par
     trades_for_order[0]['fee'] = fee_par
 
     mocker.patch('freqtrade.exchange.Exchange.get_trades_for_order', return_value=trades_for_order)
     amount = sum(x['amount'] for x in trades_for_order)
-    trade = Trade(
-        pair='LTC/ETH',
-        amount=amount,
-        exchange='binance',
-        fee_open=fee.return_value,
-        fee_close=fee.return_value,
-        open_rate=0.245441,
-        open_order_id="123456"
-    )
+    trade = real_amount_trade(amount, fee)
     freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
 
     if not use_ticker_usdt_rate:
@@ -4330,7 +4267,8 @@ def test_get_real_amount(
 
     caplog.clear()
     order_obj = Order.parse_from_ccxt_object(buy_order_fee, 'LTC/ETH', 'buy')
-    assert freqtrade.get_real_amount(trade, buy_order, order_obj) == amount - fee_reduction_amount
+    assert freqtrade.get_real_amount(trade, buy_order, order_obj) == pytest.approx(
+        amount - fee_reduction_amount)
 
     if expected_log:
         assert log_has(expected_log, caplog)
@@ -4358,27 +4296,20 @@ def test_get_real_amount_multi(
     amount = float(sum(x['amount'] for x in trades_for_order))
     default_conf_usdt['stake_currency'] = "ETH"
 
-    trade = Trade(
-        pair='LTC/ETH',
-        amount=amount,
-        exchange='binance',
-        fee_open=fee.return_value,
-        fee_close=fee.return_value,
-        open_rate=0.245441,
-        open_order_id="123456"
-    )
+    trade = real_amount_trade(amount, fee)
 
     # Fake markets entry to enable fee parsing
     markets['BNB/ETH'] = markets['ETH/USDT']
     freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
-    mocker.patch('freqtrade.exchange.Exchange.markets', PropertyMock(return_value=markets))
-    mocker.patch('freqtrade.exchange.Exchange.fetch_ticker',
-                 return_value={'ask': 0.19, 'last': 0.2})
+    mocker.patch.multiple('freqtrade.exchange.Exchange',
+                          markets=PropertyMock(return_value=markets),
+                          fetch_ticker=MagicMock(return_value={'ask': 0.19, 'last': 0.2}))
 
     # Amount is reduced by "fee"
     expected_amount = amount - (amount * fee_reduction_amount)
     order_obj = Order.parse_from_ccxt_object(buy_order_fee, 'LTC/ETH', 'buy')
-    assert freqtrade.get_real_amount(trade, buy_order_fee, order_obj) == expected_amount
+    assert freqtrade.get_real_amount(trade, buy_order_fee, order_obj) == pytest.approx(
+        expected_amount)
     assert log_has(
         (
             'Applying fee on amount for Trade(id=None, pair=LTC/ETH, amount=8.00000000, '
@@ -4388,52 +4319,23 @@ def test_get_real_amount_multi(
         caplog
     )
 
-    assert trade.fee_open == expected_fee
-    assert trade.fee_close == expected_fee
+    assert trade.fee_open == pytest.approx(expected_fee)
+    assert trade.fee_close == pytest.approx(expected_fee)
     assert trade.fee_open_cost is not None
     assert trade.fee_open_currency is not None
     assert trade.fee_close_cost is None
     assert trade.fee_close_currency is None
 
 
-def test_get_real_amount_invalid_order(default_conf_usdt, trades_for_order, buy_order_fee, fee,
-                                       mocker):
-    limit_buy_order_usdt = deepcopy(buy_order_fee)
-    limit_buy_order_usdt['fee'] = {'cost': 0.004}
-
-    mocker.patch('freqtrade.exchange.Exchange.get_trades_for_order', return_value=[])
-    amount = float(sum(x['amount'] for x in trades_for_order))
-    trade = Trade(
-        pair='LTC/ETH',
-        amount=amount,
-        exchange='binance',
-        fee_open=fee.return_value,
-        fee_close=fee.return_value,
-        open_rate=0.245441,
-        open_order_id="123456"
-    )
-    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
-
-    order_obj = Order.parse_from_ccxt_object(buy_order_fee, 'LTC/ETH', 'buy')
-    # Amount does not change
-    assert freqtrade.get_real_amount(trade, limit_buy_order_usdt, order_obj) == amount
-
-
 def test_get_real_amount_fees_order(default_conf_usdt, market_buy_order_usdt_doublefee,
                                     fee, mocker):
 
-    tfo_mock = mocker.patch('freqtrade.exchange.Exchange.get_trades_for_order', return_value=[])
-    mocker.patch('freqtrade.exchange.Exchange.get_valid_pair_combination', return_value='BNB/USDT')
-    mocker.patch('freqtrade.exchange.Exchange.fetch_ticker', return_value={'last': 200})
-    trade = Trade(
-        pair='LTC/USDT',
-        amount=30.0,
-        exchange='binance',
-        fee_open=fee.return_value,
-        fee_close=fee.return_value,
-        open_rate=0.245441,
-        open_order_id="123456"
-    )
+    tfo_mock = MagicMock(return_value=[])
+    mocker.patch.multiple('freqtrade.exchange.Exchange',
+                          get_trades_for_order=tfo_mock,
+                          get_valid_pair_combination=MagicMock(return_value='BNB/USDT'),
+                          fetch_ticker=MagicMock(return_value={'last': 200}))
+    trade = real_amount_trade(30.0, fee, pair='LTC/USDT')
     freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
 
     # Amount does not change
@@ -4447,20 +4349,12 @@ def test_get_real_amount_fees_order(default_conf_usdt, market_buy_order_usdt_dou
 
 def test_get_real_amount_wrong_amount(default_conf_usdt, trades_for_order, buy_order_fee, fee,
                                       mocker):
-    limit_buy_order_usdt = deepcopy(buy_order_fee)
+    limit_buy_order_usdt = buy_order_fee.copy()
     limit_buy_order_usdt['amount'] = limit_buy_order_usdt['amount'] - 0.001
 
     mocker.patch('freqtrade.exchange.Exchange.get_trades_for_order', return_value=trades_for_order)
     amount = float(sum(x['amount'] for x in trades_for_order))
-    trade = Trade(
-        pair='LTC/ETH',
-        amount=amount,
-        exchange='binance',
-        open_rate=0.245441,
-        fee_open=fee.return_value,
-        fee_close=fee.return_value,
-        open_order_id="123456"
-    )
+    trade = real_amount_trade(amount, fee)
     freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
 
     order_obj = Order.parse_from_ccxt_object(buy_order_fee, 'LTC/ETH', 'buy')
@@ -4472,26 +4366,17 @@ def test_get_real_amount_wrong_amount(default_conf_usdt, trades_for_order, buy_o
 def test_get_real_amount_wrong_amount_rounding(default_conf_usdt, trades_for_order, buy_order_fee,
                                                fee, mocker):
     # Floats should not be compared directly.
-    limit_buy_order_usdt = deepcopy(buy_order_fee)
     trades_for_order[0]['amount'] = trades_for_order[0]['amount'] + 1e-15
 
     mocker.patch('freqtrade.exchange.Exchange.get_trades_for_order', return_value=trades_for_order)
     amount = float(sum(x['amount'] for x in trades_for_order))
-    trade = Trade(
-        pair='LTC/ETH',
-        amount=amount,
-        exchange='binance',
-        fee_open=fee.return_value,
-        fee_close=fee.return_value,
-        open_rate=0.245441,
-        open_order_id="123456"
-    )
+    trade = real_amount_trade(amount, fee)
     freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
 
     order_obj = Order.parse_from_ccxt_object(buy_order_fee, 'LTC/ETH', 'buy')
     # Amount changes by fee amount.
     assert isclose(
-        freqtrade.get_real_amount(trade, limit_buy_order_usdt, order_obj),
+        freqtrade.get_real_amount(trade, buy_order_fee, order_obj),
         amount - (amount * 0.001),
         abs_tol=MATH_CLOSE_PREC,
     )
@@ -4499,15 +4384,7 @@ def test_get_real_amount_wrong_amount_rounding(default_conf_usdt, trades_for_ord
 
 def test_get_real_amount_open_trade_usdt(default_conf_usdt, fee, mocker):
     amount = 12345
-    trade = Trade(
-        pair='LTC/ETH',
-        amount=amount,
-        exchange='binance',
-        open_rate=0.245441,
-        fee_open=fee.return_value,
-        fee_close=fee.return_value,
-        open_order_id="123456"
-    )
+    trade = real_amount_trade(amount, fee)
     order = {
         'id': 'mocked_order',
         'amount': amount,
@@ -4572,7 +4449,7 @@ def test_order_book_depth_of_market(
     )
 
     # Save state of current whitelist
-    whitelist = deepcopy(default_conf_usdt['exchange']['pair_whitelist'])
+    whitelist = list(default_conf_usdt['exchange']['pair_whitelist'])
     freqtrade = FreqtradeBot(default_conf_usdt)
     patch_get_signal(freqtrade, enter_short=is_short, enter_long=not is_short)
     freqtrade.enter_positions()
@@ -4608,10 +4485,9 @@ def test_order_book_entry_pricing1(mocker, default_conf_usdt, order_book_l2, exc
     """
     test if function get_rate will return the order book price instead of the ask rate
     """
-    patch_exchange(mocker)
     ticker_usdt_mock = MagicMock(return_value={'ask': ask, 'last': last})
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_l2_order_book=MagicMock(return_value=order_book) if order_book else order_book_l2,
         fetch_ticker=ticker_usdt_mock,
     )
@@ -4637,9 +4513,8 @@ def test_check_depth_of_market(default_conf_usdt, mocker, order_book_l2) -> None
     """
     test check depth of market
     """
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_l2_order_book=order_book_l2
     )
     default_conf_usdt['telegram']['enabled'] = False
@@ -4666,9 +4541,8 @@ def test_order_book_exit_pricing(
     default_conf_usdt['exit_pricing']['order_book_top'] = 1
     default_conf_usdt['telegram']['enabled'] = False
     patch_RPCManager(mocker)
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=MagicMock(return_value={
             'bid': 1.9,
             'ask': 2.2,
@@ -4743,9 +4617,8 @@ def test_sync_wallet_dry_run(mocker, default_conf_usdt, ticker_usdt, fee, limit_
     default_conf_usdt['dry_run_wallet'] = 120.0
     default_conf_usdt['max_open_trades'] = 2
     default_conf_usdt['tradable_balance_ratio'] = 1.0
-    patch_exchange(mocker)
-    mocker.patch.multiple(
-        'freqtrade.exchange.Exchange',
+    patch_exchange(
+        mocker,
         fetch_ticker=ticker_usdt,
         create_order=MagicMock(return_value=limit_buy_order_usdt_open),
         get_fee=fee,
@@ -4943,7 +4816,7 @@ def test_reupdate_enter_order_fees(mocker, default_conf_usdt, fee, caplog, is_sh
         stake_amount=60.0,
         fee_open=fee.return_value,
         fee_close=fee.return_value,
-        open_date=arrow.utcnow().datetime,
+        open_date=datetime.now(timezone.utc),
         is_open=True,
         amount=30,
         open_rate=2.0,
@@ -42,6 +42,23 @@ def test_init_custom_db_url(default_conf, tmpdir):
     assert r.first() == ('wal',)
 
 
+def test_init_db_new_and_existing(default_conf, mocker, tmpdir):
+    fix_mock = mocker.patch('freqtrade.persistence.migrations.fix_old_dry_orders')
+    # New database - no need to check for migrations
+    init_db(default_conf['db_url'])
+    assert fix_mock.call_count == 0
+
+    filename = f"{tmpdir}/freqtrade_existing.sqlite"
+    init_db(f'sqlite:///{filename}')
+    assert fix_mock.call_count == 0
+    r = Trade._session.execute(text("PRAGMA journal_mode"))
+    assert r.first() == ('wal',)
+
+    # Existing database
+    init_db(f'sqlite:///{filename}')
+    assert fix_mock.call_count == 1
+
+
 def test_init_invalid_db_url():
     # Update path to a value other than default, but still in-memory
     with pytest.raises(OperationalException, match=r'.*no valid database URL*'):
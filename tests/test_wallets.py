@@ -1,12 +1,11 @@
 # pragma pylint: disable=missing-docstring
-from copy import deepcopy
 from unittest.mock import MagicMock
 
 import pytest
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT
 from freqtrade.exceptions import DependencyException
-from tests.conftest import create_mock_trades, get_patched_freqtradebot, patch_wallet
+from tests.conftest import clone_conf, create_mock_trades, get_patched_freqtradebot, patch_wallet
 
 
 def test_sync_wallet_at_boot(mocker, default_conf):
@@ -142,7 +141,7 @@ def test_get_trade_stake_amount_unlimited_amount(default_conf, ticker, balance_r
         get_fee=fee
     )
 
-    conf = deepcopy(default_conf)
+    conf = clone_conf(default_conf)
     conf['stake_amount'] = UNLIMITED_STAKE_AMOUNT
     conf['dry_run_wallet'] = 100
     conf['max_open_trades'] = 2
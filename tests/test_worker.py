@@ -53,17 +53,19 @@ def test_throttle(mocker, default_conf, caplog) -> None:
 
     caplog.set_level(logging.DEBUG)
     worker = get_patched_worker(mocker, default_conf)
+    sleep_mock = mocker.patch.object(time, 'sleep')
 
-    start = time.time()
     result = worker._throttle(throttled_func, throttle_secs=0.1)
-    end = time.time()
 
     assert result == 42
-    assert end - start > 0.1
+    # Sleeps for the remainder of throttle_secs
+    assert sleep_mock.call_count == 1
+    assert 0.0 < sleep_mock.call_args[0][0] <= 0.1
     assert log_has_re(r"Throttling with 'throttled_func\(\)': sleep for \d\.\d{2} s.*", caplog)
 
     result = worker._throttle(throttled_func, throttle_secs=-1)
     assert result == 42
+    assert sleep_mock.call_args[0][0] == 0.0
 
 
 def test_throttle_with_assets(mocker, default_conf) -> None:
@@ -71,6 +73,7 @@ def test_throttle_with_assets(mocker, default_conf) -> None:
         return nb_assets
 
     worker = get_patched_worker(mocker, default_conf)
+    mocker.patch.object(time, 'sleep')
 
     result = worker._throttle(throttled_func, throttle_secs=0.1, nb_assets=666)
     assert result == 666